@@ -0,0 +1,596 @@
+# -*- coding: utf-8 -*-
+"""
+Log Listener Entry
+로그 리스너 실행 코드 - 표준 라이브러리만 사용 (spawn 시 자식 프로세스 import 최소화)
+"""
+
+import logging
+import logging.handlers
+import marshal
+import os
+import queue
+import re
+import time
+import zlib
+from multiprocessing import Queue
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from service.core._ringbuf import SharedRing
+
+
+# 리스너 유휴 대기 시간 범위 (초)
+_IDLE_WAIT_MIN = 0.001
+_IDLE_WAIT_MAX = 0.05
+
+# writev 한 번에 넘길 수 있는 최대 버퍼 수
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
+
+
+# ==================== Record Codec ====================
+
+# 프로세스 간 전달할 LogRecord 속성 (포맷터가 사용하는 값)
+_RECORD_FIELDS = (
+    "name",
+    "levelno",
+    "levelname",
+    "pathname",
+    "filename",
+    "module",
+    "lineno",
+    "funcName",
+    "created",
+    "msecs",
+    "relativeCreated",
+    "thread",
+    "threadName",
+    "process",
+    "processName",
+    "msg",
+    "exc_text",
+    "stack_info",
+    "_target_logger",
+)
+
+# 예외 정보 문자열 변환용
+_exc_formatter = logging.Formatter()
+
+
+def _pack_record(record: logging.LogRecord) -> bytes:
+    """LogRecord를 바이트로 직렬화 (메시지는 미리 완성)"""
+    return marshal.dumps(
+        (
+            record.name,
+            record.levelno,
+            record.levelname,
+            record.pathname,
+            record.filename,
+            record.module,
+            record.lineno,
+            record.funcName,
+            record.created,
+            record.msecs,
+            record.relativeCreated,
+            record.thread,
+            record.threadName,
+            record.process,
+            record.processName,
+            record.getMessage(),
+            record.exc_text,
+            record.stack_info,
+            record._target_logger,
+        )
+    )
+
+
+def _unpack_record(payload: bytes) -> logging.LogRecord:
+    """바이트를 LogRecord로 복원"""
+    attrs = dict(zip(_RECORD_FIELDS, marshal.loads(payload)))
+    attrs["args"] = None
+    return logging.makeLogRecord(attrs)
+
+
+# ==================== Messages ====================
+
+
+class _DropNotice:
+    """큐가 가득 차 버려진 레코드 수 알림 (리스너가 출력)"""
+
+    def __init__(self, logger_name: str, count: int):
+        self.logger_name = logger_name
+        self.count = count
+
+
+class _AttachLogger:
+    """리스너에 로거 출력 설정 등록 (연결 메시지)"""
+
+    def __init__(
+        self,
+        name: str,
+        log_dir: Path,
+        log_level: int,
+        console_output: bool,
+        file_output: bool,
+        max_bytes: int,
+        backup_count: int,
+    ):
+        self.name = name
+        self.log_dir = log_dir
+        self.log_level = log_level
+        self.console_output = console_output
+        self.file_output = file_output
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+
+        # 리스너 라우팅 키 (이름 + 출력 설정) - 같은 이름이라도 설정이 다르면 별도 핸들러 사용
+        settings = (str(log_dir), log_level, console_output, file_output, max_bytes, backup_count)
+        self.key = f"{name}#{zlib.crc32(repr(settings).encode()):08x}"
+
+
+class _DetachLogger:
+    """리스너에서 로거 해제 (분리 메시지)"""
+
+    def __init__(self, key: str):
+        self.key = key
+
+
+# ==================== Fast Formatter ====================
+
+# %-스타일 필드: %(name)[flags][width][.precision]type
+_FIELD_PATTERN = re.compile(r"%\((\w+)\)(-?)(\d*)(?:\.(\d+))?([sdifr])|%%")
+
+# 포맷 문자열별 생성된 렌더 함수 캐시
+_compiled_formats: dict = {}
+
+
+def _compile_format(fmt: str):
+    """
+    %-스타일 포맷 문자열을 f-string 렌더 함수로 변환 (포맷별 1회)
+
+    Returns:
+        record를 받아 문자열을 반환하는 함수 (지원하지 않는 지정자면 None)
+    """
+    if fmt in _compiled_formats:
+        return _compiled_formats[fmt]
+
+    template = []
+    position = 0
+    supported = True
+    for match in _FIELD_PATTERN.finditer(fmt):
+        literal = fmt[position : match.start()]
+        if "%" in literal:
+            supported = False
+            break
+        template.append(literal.replace("{", "{{").replace("}", "}}"))
+        position = match.end()
+
+        if match.group(0) == "%%":
+            template.append("%")
+            continue
+
+        name, left, width, precision, conversion = match.groups()
+        spec = ""
+        if width:
+            spec = ("<" if left else ">") + width
+        if precision:
+            spec += "." + precision
+
+        if conversion == "s":
+            field = f"r.{name}!s"
+        elif conversion == "r":
+            field = f"r.{name}!r"
+        elif conversion == "f":
+            field = f"r.{name}"
+            spec += "f" if precision else ".6f"
+        else:
+            # %d / %i는 실수를 버림 처리
+            field = f"int(r.{name})"
+            spec += "d"
+        template.append("{" + field + (":" + spec if spec else "") + "}")
+
+    render = None
+    if supported and "%" not in fmt[position:]:
+        template.append(fmt[position:].replace("{", "{{").replace("}", "}}"))
+        namespace: dict = {}
+        exec(f"def render(r):\n    return f{''.join(template)!r}\n", namespace)
+        render = namespace["render"]
+
+    _compiled_formats[fmt] = render
+    return render
+
+
+class FastFormatter(logging.Formatter):
+    """
+    포맷 문자열을 미리 컴파일한 Formatter (출력은 logging.Formatter와 동일)
+
+    - 레코드마다 % 연산 대신 생성된 f-string 함수로 메시지 조립
+    - datefmt 사용 시 같은 초의 asctime 문자열 재사용
+    """
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None, style: str = "%"):
+        super().__init__(fmt=fmt, datefmt=datefmt, style=style)
+        self._render = _compile_format(self._fmt) if style == "%" else None
+        self._time_key = None
+        self._time_text = ""
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        if self._render is None:
+            return super().formatMessage(record)
+        return self._render(record)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+
+        # 초 단위 포맷이므로 같은 초면 이전 결과 재사용
+        key = int(record.created)
+        if key != self._time_key:
+            self._time_text = time.strftime(datefmt, self.converter(record.created))
+            self._time_key = key
+        return self._time_text
+
+
+# ==================== Log Listener Process ====================
+
+# 연결 메시지보다 먼저 도착한 레코드 보류 한도 (로거별)
+_PENDING_MAX = 10000
+
+# 보류 레코드 유지 시간 (초) - 그동안 연결되지 않으면 버림 (분리 후 도착한 레코드 등)
+_PENDING_TTL = 5.0
+
+
+def _log_listener_process(
+    log_queue: Queue,
+    log_ring: Optional["SharedRing"],
+    batch_size: int,
+):
+    """
+    별도 프로세스(또는 스레드)에서 실행되는 로그 리스너
+    여러 로거의 레코드를 받아 대상 로거별 핸들러로 출력 (최대 batch_size개씩 일괄 기록)
+    """
+    # 로거 이름별 리스너 로거 / 연결 수 / 연결 전에 도착한 레코드
+    listeners: dict = {}
+    refcounts: dict = {}
+    pending: dict = {}
+
+    # 로그 레코드 수신 및 처리 루프
+    idle_wait = _IDLE_WAIT_MIN
+    stopping = False
+    while not stopping:
+        try:
+            # 링/큐에 쌓인 레코드를 한 번에 수집 (연결/분리 메시지에서 멈춤)
+            records = []
+            controls = []
+            stopping = _collect_batch(log_queue, log_ring, batch_size, records, controls)
+
+            # 비어 있으면 큐 대기
+            if not records and not controls and not stopping:
+                if log_ring is None:
+                    # 링이 없으면 (스레드 모드) 레코드는 큐로만 오므로 주기적 깨어남 없이 대기
+                    item = log_queue.get()
+                else:
+                    # 링은 대기할 수 없으므로 큐를 짧게 기다리며 폴링 (유휴 시 대기 시간 점증)
+                    try:
+                        item = log_queue.get(timeout=idle_wait)
+                    except queue.Empty:
+                        idle_wait = min(idle_wait * 2, _IDLE_WAIT_MAX)
+                        continue
+
+                # 종료 신호 확인
+                if item is None:
+                    stopping = True
+                else:
+                    _append_item(records, controls, item)
+
+            # 로그 레코드 처리
+            _dispatch(listeners, pending, records)
+            if pending:
+                _expire_pending(pending)
+            idle_wait = _IDLE_WAIT_MIN
+
+            # 로거 연결/분리
+            for control in controls:
+                if isinstance(control, _AttachLogger):
+                    _attach_listener(listeners, refcounts, pending, control)
+                else:
+                    # 분리 전 링에 남은 레코드 먼저 기록
+                    _drain_ring(log_ring, batch_size, listeners, pending)
+                    _detach_listener(listeners, refcounts, pending, control.key)
+
+            # 종료 전 링에 남은 레코드 처리
+            if stopping:
+                _drain_ring(log_ring, batch_size, listeners, pending)
+
+        except KeyboardInterrupt:
+            break
+        except Exception as e:
+            print(f"[로그 리스너 에러] {e}")
+
+    # 종료 전 핸들러 정리
+    for listener in listeners.values():
+        for handler in listener.handlers:
+            handler.close()
+
+    if log_ring is not None:
+        log_ring.close()
+
+
+def _build_listener(config: _AttachLogger) -> logging.Logger:
+    """로거 출력 설정으로 리스너 로거(콘솔/파일 핸들러) 생성"""
+    # 리스너 전용 로거 설정 (스레드 모드에서 루트 로거로 중복 출력 방지)
+    listener = logging.getLogger(f"{config.key}_listener")
+    listener.setLevel(config.log_level)
+    listener.handlers.clear()
+    listener.propagate = False
+
+    # 포맷터 설정
+    console_fmt = FastFormatter(
+        fmt="%(asctime)s [%(levelname)-8s] %(name)s - [%(filename)s:%(lineno)d] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+    file_fmt = FastFormatter(
+        fmt="%(asctime)s [%(levelname)-8s] %(name)s - [%(pathname)s:%(lineno)d in %(funcName)s()] - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+    # 콘솔 핸들러
+    if config.console_output:
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(config.log_level)
+        console_handler.setFormatter(console_fmt)
+        listener.addHandler(console_handler)
+
+    # 파일 핸들러
+    if config.file_output:
+        config.log_dir.mkdir(parents=True, exist_ok=True)
+
+        # 일반 로그
+        log_file = config.log_dir / f"{config.name}.log"
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=config.max_bytes,
+            backupCount=config.backup_count,
+            encoding="utf-8",
+        )
+        file_handler.setLevel(config.log_level)
+        file_handler.setFormatter(file_fmt)
+        listener.addHandler(file_handler)
+
+        # 에러 로그
+        error_log = config.log_dir / f"{config.name}_error.log"
+        error_handler = logging.handlers.RotatingFileHandler(
+            error_log,
+            maxBytes=config.max_bytes,
+            backupCount=config.backup_count,
+            encoding="utf-8",
+        )
+        error_handler.setLevel(logging.ERROR)
+        error_handler.setFormatter(file_fmt)
+        listener.addHandler(error_handler)
+
+    return listener
+
+
+def _attach_listener(listeners: dict, refcounts: dict, pending: dict, config: _AttachLogger):
+    """로거 연결 (같은 이름/설정이 이미 있으면 기존 핸들러 공유)"""
+    name = config.key
+    refcounts[name] = refcounts.get(name, 0) + 1
+    if name not in listeners:
+        listeners[name] = _build_listener(config)
+
+    # 연결 전에 도착한 레코드 기록
+    waiting = pending.pop(name, None)
+    if waiting:
+        _handle_batch(listeners[name], waiting)
+
+
+def _detach_listener(listeners: dict, refcounts: dict, pending: dict, name: str):
+    """로거 분리 (마지막 연결이면 핸들러와 보류 레코드 정리)"""
+    count = refcounts.get(name, 0) - 1
+    if count > 0:
+        refcounts[name] = count
+        return
+
+    refcounts.pop(name, None)
+    pending.pop(name, None)
+    listener = listeners.pop(name, None)
+    if listener is not None:
+        for handler in listener.handlers:
+            handler.close()
+        listener.handlers.clear()
+
+
+def _dispatch(listeners: dict, pending: dict, records: list):
+    """레코드를 대상 로거별 연속 구간으로 나눠 기록 (수신 순서 유지)"""
+    start = 0
+    count = len(records)
+    while start < count:
+        target = records[start]._target_logger
+        end = start + 1
+        while end < count and records[end]._target_logger == target:
+            end += 1
+
+        listener = listeners.get(target)
+        if listener is not None:
+            _handle_batch(listener, records[start:end])
+        else:
+            # 연결 메시지보다 먼저 도착한 레코드는 보류
+            waiting = pending.setdefault(target, [])
+            waiting.extend(records[start : min(end, start + max(0, _PENDING_MAX - len(waiting)))])
+        start = end
+
+
+def _expire_pending(pending: dict):
+    """_PENDING_TTL 넘게 연결되지 않은 로거의 보류 레코드 버림 (가장 오래된 레코드 기준)"""
+    expires = time.time() - _PENDING_TTL
+    for name in [name for name, waiting in pending.items() if waiting and waiting[0].created < expires]:
+        print(f"[로그 리스너] {name}: 연결되지 않은 로거의 로그 {len(pending.pop(name))}개를 버렸습니다")
+
+
+def _drain_ring(log_ring: Optional["SharedRing"], batch_size: int, listeners: dict, pending: dict):
+    """링에 남은 레코드를 모두 기록"""
+    while log_ring is not None:
+        records = []
+        _collect_batch(None, log_ring, batch_size, records, [])
+        if not records:
+            break
+        _dispatch(listeners, pending, records)
+
+
+def _collect_batch(
+    log_queue: Optional[Queue],
+    log_ring: Optional["SharedRing"],
+    batch_size: int,
+    records: list,
+    controls: list,
+) -> bool:
+    """
+    링 버퍼와 큐에서 대기 없이 최대 batch_size개 레코드 수집
+    (연결/분리 메시지를 받으면 그 뒤 레코드보다 먼저 처리되도록 수집 중단)
+
+    Returns:
+        bool: 종료 신호 수신 여부
+    """
+    if log_ring is not None:
+        while len(records) < batch_size:
+            payload = log_ring.get()
+            if payload is None:
+                break
+            records.append(_unpack_record(payload))
+
+    if log_queue is not None:
+        while len(records) < batch_size and not controls:
+            try:
+                item = log_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                return True
+            _append_item(records, controls, item)
+
+    return False
+
+
+def _append_item(records: list, controls: list, item):
+    """큐 항목을 종류별로 처리 (직렬화된 레코드 / LogRecord / 연결 메시지 / 유실 알림)"""
+    if type(item) is bytes:
+        records.append(_unpack_record(item))
+    elif isinstance(item, (_AttachLogger, _DetachLogger)):
+        controls.append(item)
+    elif isinstance(item, _DropNotice):
+        print(f"[로그 리스너] {item.logger_name}: 큐가 가득 차 로그 {item.count}개를 버렸습니다")
+    else:
+        records.append(item)
+
+
+def _handle_batch(listener: logging.Logger, records: list):
+    """수집된 레코드를 핸들러별로 한 번에 기록"""
+    if len(records) == 1:
+        listener.handle(records[0])
+        return
+
+    if listener.disabled:
+        return
+    records = [record for record in records if listener.filter(record)]
+
+    for handler in listener.handlers:
+        if isinstance(handler, logging.StreamHandler):
+            _write_batch(handler, records)
+            continue
+
+        # 스트림 핸들러가 아니면 레코드 단위 처리
+        for record in records:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+def _write_batch(handler: logging.StreamHandler, records: list):
+    """
+    포맷된 레코드를 합쳐 한 번의 write/flush로 기록
+
+    에러는 레코드 단위 기록(emit)처럼 handleError()로 보고
+    (포맷 실패 레코드만 건너뛰고, 기록 중 에러는 일부가 이미 기록됐을 수 있으므로 다시 기록하지 않음)
+    """
+    terminator = handler.terminator
+    lines = []
+    last = None
+    for record in records:
+        if record.levelno >= handler.level and handler.filter(record):
+            try:
+                lines.append(handler.format(record) + terminator)
+                last = record
+            except Exception:
+                handler.handleError(record)
+    if not lines:
+        return
+
+    try:
+        _write_locked(handler, lines)
+    except Exception:
+        handler.handleError(last)
+
+
+def _write_locked(handler: logging.StreamHandler, lines: list):
+    """핸들러 락 안에서 줄 기록 (파일 열기/로테이션 포함)"""
+    with handler.lock:
+        if isinstance(handler, logging.FileHandler) and handler.stream is None:
+            handler.stream = handler._open()
+
+        # 로테이션 경계에서 나눠 기록 (레코드 단위 기록과 같은 기준)
+        if isinstance(handler, logging.handlers.RotatingFileHandler) and handler.maxBytes > 0:
+            handler.stream.seek(0, 2)
+            position = handler.stream.tell()
+            start = 0
+            for index, line in enumerate(lines):
+                if position > 0 and position + len(line) >= handler.maxBytes:
+                    if index > start:
+                        _write_lines(handler.stream, lines[start:index])
+                    handler.doRollover()
+                    position = 0
+                    start = index
+                position += len(line)
+            lines = lines[start:]
+
+        _write_lines(handler.stream, lines)
+        handler.flush()
+
+
+def _write_lines(stream, lines: list):
+    """
+    여러 줄을 한 번에 기록 (파일 디스크립터가 있으면 writev로 합치기 없이 전달)
+
+    텍스트 스트림의 버퍼를 먼저 비운 뒤 같은 인코딩으로 변환해 기록
+    """
+    fd = None
+    if hasattr(os, "writev"):
+        try:
+            fd = stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            fd = None
+
+    if fd is None:
+        stream.write("".join(lines))
+        return
+
+    stream.flush()
+    encoding = getattr(stream, "encoding", None) or "utf-8"
+    errors = getattr(stream, "errors", None) or "strict"
+    parts = [line.encode(encoding, errors) for line in lines]
+
+    # 부분 기록 시 남은 버퍼부터 이어서 기록
+    index = 0
+    count = len(parts)
+    while index < count:
+        written = os.writev(fd, parts[index : index + _IOV_MAX])
+        while index < count and written >= len(parts[index]):
+            written -= len(parts[index])
+            index += 1
+        if written:
+            parts[index] = parts[index][written:]
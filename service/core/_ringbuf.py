@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+Shared Memory Ring Buffer
+공유 메모리 기반 고정 슬롯 링 버퍼 - 프로세스 간 바이트 전송용
+"""
+
+import ctypes
+import os
+import struct
+import threading
+import weakref
+from multiprocessing import shared_memory
+from typing import Optional
+
+
+# ==================== Layout ====================
+
+# head/tail 카운터는 캐시 라인(64 bytes)을 분리해 false sharing 방지
+_CACHE_LINE = 64
+_HEAD_OFFSET = 0
+_TAIL_OFFSET = _CACHE_LINE
+_DATA_OFFSET = _CACHE_LINE * 2
+
+# 슬롯 구조: [4 bytes: length][N bytes: payload]
+_SLOT_LEN = struct.Struct("<I")
+
+
+# ==================== Shared Ring ====================
+
+
+class SharedRing:
+    """
+    공유 메모리 링 버퍼 (단일 소비자)
+
+    - 생산자는 tail만, 소비자는 head만 갱신 (프로세스 간 락 없음)
+    - 같은 프로세스의 생산자 스레드끼리는 프로세스 내부 락으로 직렬화
+    - 슬롯이 가득 찼거나 페이로드가 슬롯보다 크면 put()이 False 반환
+    """
+
+    def __init__(
+        self,
+        capacity: int = 4096,
+        slot_size: int = 1024,
+        name: Optional[str] = None,
+    ):
+        """
+        링 버퍼 생성 또는 연결
+
+        Args:
+            capacity: 슬롯 개수
+            slot_size: 슬롯 크기 (길이 헤더 포함)
+            name: 기존 공유 메모리 이름 (None이면 새로 생성)
+        """
+        self.capacity = capacity
+        self.slot_size = slot_size
+        self._max_payload = slot_size - _SLOT_LEN.size
+        self._owner = name is None
+
+        self._shm = shared_memory.SharedMemory(
+            name=name,
+            create=self._owner,
+            size=_DATA_OFFSET + capacity * slot_size,
+        )
+        self._buf = self._shm.buf
+        self._head = ctypes.c_uint64.from_buffer(self._buf, _HEAD_OFFSET)
+        self._tail = ctypes.c_uint64.from_buffer(self._buf, _TAIL_OFFSET)
+
+        # 같은 프로세스 내 생산자 스레드 직렬화 (프로세스 간 공유 안 됨)
+        self._put_lock = threading.Lock()
+        self._producer = True
+        _rings.add(self)
+
+    @property
+    def name(self) -> str:
+        """공유 메모리 이름"""
+        return self._shm.name
+
+    def __reduce__(self):
+        """spawn 방식 프로세스 전달 시 이름으로 재연결"""
+        return (_attach_ring, (self.name, self.capacity, self.slot_size))
+
+    # ==================== Producer ====================
+
+    def put(self, payload: bytes) -> bool:
+        """
+        페이로드를 슬롯에 기록
+
+        Returns:
+            bool: 기록 성공 여부 (가득 참/크기 초과/닫힘이면 False)
+        """
+        size = len(payload)
+        if size > self._max_payload or not self._producer:
+            return False
+
+        with self._put_lock:
+            buf = self._buf
+            if buf is None:
+                return False
+
+            tail = self._tail.value
+            if tail - self._head.value >= self.capacity:
+                return False
+
+            offset = _DATA_OFFSET + (tail % self.capacity) * self.slot_size
+            _SLOT_LEN.pack_into(buf, offset, size)
+            start = offset + _SLOT_LEN.size
+            buf[start : start + size] = payload
+
+            # 슬롯 기록 후 tail 공개
+            self._tail.value = tail + 1
+        return True
+
+    # ==================== Consumer ====================
+
+    def get(self) -> Optional[bytes]:
+        """
+        가장 오래된 슬롯을 읽어 반환 (소비자 전용)
+
+        Returns:
+            bytes 또는 None (비어 있음)
+        """
+        buf = self._buf
+        if buf is None:
+            return None
+
+        head = self._head.value
+        if head == self._tail.value:
+            return None
+
+        offset = _DATA_OFFSET + (head % self.capacity) * self.slot_size
+        size = _SLOT_LEN.unpack_from(buf, offset)[0]
+        start = offset + _SLOT_LEN.size
+        payload = bytes(buf[start : start + size])
+
+        # 복사 완료 후 슬롯 반환
+        self._head.value = head + 1
+        return payload
+
+    def __len__(self) -> int:
+        """대기 중인 슬롯 수"""
+        if self._buf is None:
+            return 0
+        return self._tail.value - self._head.value
+
+    # ==================== Lifecycle ====================
+
+    def close(self):
+        """매핑 해제 (생성한 프로세스는 공유 메모리도 삭제)"""
+        with self._put_lock:
+            if self._buf is None:
+                return
+
+            # ctypes 뷰가 버퍼를 잡고 있으면 close 불가
+            self._head = None
+            self._tail = None
+            self._buf = None
+            self._shm.close()
+
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _attach_ring(name: str, capacity: int, slot_size: int) -> SharedRing:
+    """이름으로 기존 링 버퍼에 연결 (소비자 프로세스용)"""
+    # 자식 프로세스는 부모의 resource_tracker를 공유하므로 등록 해제하지 않음
+    # (해제하면 생성자의 unlink 시 tracker에서 KeyError 발생)
+    return SharedRing(capacity=capacity, slot_size=slot_size, name=name)
+
+
+# ==================== Fork Safety ====================
+
+# fork된 자식 프로세스는 부모의 락을 공유하지 않으므로 생산 비활성화
+_rings: "weakref.WeakSet[SharedRing]" = weakref.WeakSet()
+
+
+def _disable_producers_after_fork():
+    for ring in list(_rings):
+        ring._producer = False
+        ring._put_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_disable_producers_after_fork)
@@ -5,130 +5,246 @@ Async Logger Core
 """
 
 import logging
-import logging.handlers
+import multiprocessing
+import queue
+import sys
+import threading
 from multiprocessing import Queue, Process
 from pathlib import Path
 from typing import Optional
 import atexit
 
+from service.core._ringbuf import SharedRing
+from service.core._listener_entry import (
+    FastFormatter,
+    _AttachLogger,
+    _DetachLogger,
+    _DropNotice,
+    _exc_formatter,
+    _log_listener_process,
+    _pack_record,
+)
+
+
+# 링 버퍼 기본 크기 (슬롯 4096개 x 1KB)
+_RING_CAPACITY = 4096
+_RING_SLOT_SIZE = 1024
+
+# 리스너 실행 방식 ("thread": 같은 프로세스 스레드, "process": 별도 프로세스)
+_LISTENER_KINDS = ("thread", "process")
+
+# 리스너 프로세스 시작 방식 (Linux는 fork로 import 없이 시작, 그 외는 spawn)
+_PROCESS_START_METHOD = "fork" if sys.platform.startswith("linux") else "spawn"
+
 
 # ==================== Queue Handler ====================
 
 
 class AsyncQueueHandler(logging.Handler):
-    """비동기 큐 핸들러 - 멀티프로세스 통신용"""
+    """비동기 큐 핸들러 - 리스너(스레드/프로세스)로 레코드 전달"""
 
-    def __init__(self, queue: Queue):
+    def __init__(
+        self,
+        queue: Queue,
+        ring: Optional[SharedRing] = None,
+        block_on_full: bool = False,
+        preserve_record: bool = False,
+        local: bool = False,
+        target: Optional[str] = None,
+    ):
         super().__init__()
         self.queue = queue
+        self.ring = ring
+        self.block_on_full = block_on_full
+
+        # True면 LogRecord 전체를 pickle로 전송 (사용자 정의 속성 보존, 링 미사용)
+        self.preserve_record = preserve_record
+
+        # True면 같은 프로세스 리스너 - 직렬화 없이 레코드 객체 전달
+        self.local = local
+
+        # 리스너에서 출력할 대상 (로거 연결 키, None이면 레코드의 로거 이름)
+        self.target = target
+
+        # 큐가 가득 차 버린 레코드 수 (누적 / 리스너에 알린 수)
+        self._dropped = 0
+        self._reported = 0
 
     def emit(self, record: logging.LogRecord):
-        """로그 레코드를 큐에 전송"""
+        """로그 레코드를 링 버퍼(가득 차면 큐)에 전송"""
         try:
+            # 아직 알리지 않은 유실 건수 전달
+            if self._dropped != self._reported:
+                self._report_dropped(record.name)
+
+            # 공유 리스너 라우팅 키
+            record._target_logger = self.target or record.name
+
             # 예외 정보 직렬화 (traceback 객체는 pickle 불가)
             if record.exc_info:
-                record.exc_text = self.format(record)
+                if not record.exc_text:
+                    record.exc_text = _exc_formatter.formatException(record.exc_info)
                 record.exc_info = None
 
-            # 호출 위치 정보를 미리 문자열로 저장
-            # (프로세스 간 전달 시 스택 프레임 정보가 손실되므로)
-            if not hasattr(record, "_location_formatted"):
-                record._location_formatted = True
-
-            # 큐에 레코드 전송 (non-blocking)
-            self.queue.put_nowait(record)
+            if self.local:
+                # 호출 측에서 인자가 바뀌기 전에 메시지 확정
+                record.msg = record.getMessage()
+                record.args = None
+                item = record
+            elif self.preserve_record:
+                item = record
+            else:
+                # 포맷에 필요한 속성만 바이트로 직렬화 (링/큐 공통)
+                item = _pack_record(record)
+
+                # 링 버퍼 우선 (락/pickle 없음)
+                if self.ring is not None and self.ring.put(item):
+                    return
+
+            # 링이 가득 찼거나 레코드가 슬롯보다 크면 큐로 전송
+            if self.block_on_full:
+                self.queue.put(item)
+                return
+
+            # non-blocking - 큐도 가득 차면 레코드를 버리고 건수만 기록
+            try:
+                self.queue.put_nowait(item)
+            except queue.Full:
+                self._dropped += 1
         except Exception:
             self.handleError(record)
 
+    def _report_dropped(self, logger_name: str):
+        """버려진 레코드 수를 리스너에 알림 (큐에 여유가 있을 때만)"""
+        dropped = self._dropped
+        try:
+            self.queue.put_nowait(_DropNotice(logger_name, dropped - self._reported))
+            self._reported = dropped
+        except queue.Full:
+            pass
+
+    @property
+    def dropped(self) -> int:
+        """큐가 가득 차 버린 레코드 수"""
+        return self._dropped
 
-# ==================== Log Listener Process ====================
 
+# ==================== Listener Hub ====================
 
-def _log_listener_process(
-    log_queue: Queue,
-    logger_name: str,
-    log_dir: Path,
-    log_level: int,
-    console_output: bool,
-    file_output: bool,
-    max_bytes: int,
-    backup_count: int,
-):
+
+class LogListenerHub:
     """
-    별도 프로세스에서 실행되는 로그 리스너
-    큐에서 로그 레코드를 받아 실제 출력 처리
+    여러 AsyncLoggerCore가 공유하는 로그 리스너 (스레드 또는 프로세스 1개)
+
+    - 로거마다 연결/분리 메시지로 출력 설정을 등록/해제
+    - 레코드는 대상 로거 이름으로 라우팅
+    - 마지막 로거가 분리되면 리스너 종료 (다음 연결 시 재시작)
     """
-    # 리스너 전용 로거 설정
-    listener = logging.getLogger(f"{logger_name}_listener")
-    listener.setLevel(log_level)
-    listener.handlers.clear()
-
-    # 포맷터 설정
-    console_fmt = logging.Formatter(
-        fmt="%(asctime)s [%(levelname)-8s] %(name)s - [%(filename)s:%(lineno)d] %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-
-    file_fmt = logging.Formatter(
-        fmt="%(asctime)s [%(levelname)-8s] %(name)s - [%(pathname)s:%(lineno)d in %(funcName)s()] - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-
-    # 콘솔 핸들러
-    if console_output:
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(log_level)
-        console_handler.setFormatter(console_fmt)
-        listener.addHandler(console_handler)
-
-    # 파일 핸들러
-    if file_output:
-        log_dir.mkdir(parents=True, exist_ok=True)
-
-        # 일반 로그
-        log_file = log_dir / f"{logger_name}.log"
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file,
-            maxBytes=max_bytes,
-            backupCount=backup_count,
-            encoding="utf-8",
-        )
-        file_handler.setLevel(log_level)
-        file_handler.setFormatter(file_fmt)
-        listener.addHandler(file_handler)
-
-        # 에러 로그
-        error_log = log_dir / f"{logger_name}_error.log"
-        error_handler = logging.handlers.RotatingFileHandler(
-            error_log,
-            maxBytes=max_bytes,
-            backupCount=backup_count,
-            encoding="utf-8",
+
+    def __init__(self, listener: str = "thread", queue_size: int = 65536, batch_size: int = 256):
+        """
+        공유 리스너 초기화 (리스너는 첫 연결 시 시작)
+
+        Args:
+            listener: 리스너 실행 방식 ("thread": 같은 프로세스 스레드, "process": 별도 프로세스)
+            queue_size: 대기 큐 최대 크기
+            batch_size: 리스너가 한 번에 기록할 최대 레코드 수
+
+        Raises:
+            ValueError: 지원하지 않는 listener 값
+        """
+        if listener not in _LISTENER_KINDS:
+            raise ValueError(f"지원하지 않는 listener: {listener!r} (가능: {_LISTENER_KINDS})")
+
+        self.kind = listener
+        self.queue_size = queue_size
+        self.batch_size = max(1, batch_size)
+
+        self.log_queue = None
+        self.log_ring: Optional[SharedRing] = None
+        self.worker = None
+
+        # 연결된 로거 수
+        self._refs = 0
+        self._lock = threading.Lock()
+
+    def attach(self, config: _AttachLogger):
+        """로거 연결 (리스너가 없으면 시작)"""
+        with self._lock:
+            if self.worker is None:
+                self._start()
+            self._refs += 1
+            self.log_queue.put(config)
+
+    def detach(self, key: str):
+        """로거 분리 (마지막 로거면 리스너 종료)"""
+        with self._lock:
+            if self.worker is None:
+                return
+
+            try:
+                self.log_queue.put(_DetachLogger(key), timeout=1)
+            except Exception:
+                pass
+
+            self._refs -= 1
+            if self._refs <= 0:
+                self._stop()
+
+    def is_alive(self) -> bool:
+        """리스너 스레드/프로세스 상태 확인"""
+        worker = self.worker
+        return worker is not None and worker.is_alive()
+
+    def _start(self):
+        """큐/링 생성 후 리스너 시작"""
+        if self.kind == "thread":
+            # 같은 프로세스 - 스레드 큐로 레코드 객체 전달 (직렬화 없음)
+            self.log_queue = queue.Queue(self.queue_size)
+            self.log_ring = None
+            worker_class = threading.Thread
+        else:
+            context = multiprocessing.get_context(_PROCESS_START_METHOD)
+
+            # 멀티프로세스 통신 큐 (링 버퍼가 가득 찼을 때 사용, 크기 제한)
+            self.log_queue = context.Queue(self.queue_size)
+
+            # 공유 메모리 링 버퍼 (기본 전송 경로)
+            self.log_ring = SharedRing(capacity=_RING_CAPACITY, slot_size=_RING_SLOT_SIZE)
+            worker_class = context.Process
+
+        self.worker = worker_class(
+            target=_log_listener_process,
+            args=(self.log_queue, self.log_ring, self.batch_size),
+            daemon=True,
+            name=f"LogListener-{self.kind}",
         )
-        error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(file_fmt)
-        listener.addHandler(error_handler)
+        self.worker.start()
 
-    # 로그 레코드 수신 및 처리 루프
-    while True:
-        try:
-            record = log_queue.get()
+    def _stop(self):
+        """리스너 종료 및 링 해제"""
+        worker = self.worker
+        self.worker = None
 
-            # 종료 신호 확인
-            if record is None:
-                break
+        if worker.is_alive():
+            # 종료 신호 전송
+            try:
+                self.log_queue.put(None, timeout=1)
+            except Exception:
+                pass
 
-            # 로그 레코드 처리
-            listener.handle(record)
+            # 리스너 종료 대기
+            worker.join(timeout=3)
 
-        except KeyboardInterrupt:
-            break
-        except Exception as e:
-            print(f"[로그 리스너 에러] {e}")
+            # 강제 종료 (프로세스만 가능)
+            if self.kind == "process" and worker.is_alive():
+                worker.terminate()
+                worker.join(timeout=1)
 
-    # 종료 전 핸들러 정리
-    for handler in listener.handlers:
-        handler.close()
+        # 링 버퍼 해제
+        if self.log_ring is not None:
+            self.log_ring.close()
+            self.log_ring = None
 
 
 # ==================== Async Logger Core ====================
@@ -148,6 +264,13 @@ class AsyncLoggerCore:
         file_output: bool = True,
         max_bytes: int = 10 * 1024 * 1024,  # 10MB
         backup_count: int = 5,
+        batch_size: int = 256,
+        queue_size: int = 65536,
+        block_on_full: bool = False,
+        preserve_record: bool = False,
+        caller_info: bool = True,
+        listener: str = "thread",
+        hub: Optional[LogListenerHub] = None,
     ):
         """
         비동기 로거 코어 초기화
@@ -160,7 +283,20 @@ class AsyncLoggerCore:
             file_output: 파일 출력 여부
             max_bytes: 로그 파일 최대 크기
             backup_count: 백업 파일 개수
+            batch_size: 리스너가 한 번에 기록할 최대 레코드 수 (1이면 레코드 단위 기록)
+            queue_size: 대기 큐 최대 크기 (가득 차면 새 레코드를 버림)
+            block_on_full: 큐가 가득 찼을 때 버리지 않고 호출 측을 대기시킬지 여부
+            preserve_record: LogRecord 전체를 전송할지 여부 (extra 등 사용자 속성 보존용)
+            caller_info: 호출 위치(파일/줄/함수) 기록 여부 (False면 스택 탐색 생략)
+            listener: 리스너 실행 방식 ("thread": 같은 프로세스 스레드, "process": 별도 프로세스)
+            hub: 공유 리스너 (None이면 전용 리스너 생성, 주어지면 listener/queue_size/batch_size는 hub 설정을 따름)
+
+        Raises:
+            ValueError: 지원하지 않는 listener 값
         """
+        if hub is None:
+            hub = LogListenerHub(listener, queue_size=queue_size, batch_size=batch_size)
+
         self.name = name
         self.log_dir = Path(log_dir)
         self.log_level = log_level
@@ -168,38 +304,48 @@ class AsyncLoggerCore:
         self.file_output = file_output
         self.max_bytes = max_bytes
         self.backup_count = backup_count
-
-        # 멀티프로세스 통신 큐
-        self.log_queue: Queue = Queue(-1)
-
-        # 리스너 프로세스
-        self.listener_process: Optional[Process] = None
+        self.batch_size = hub.batch_size
+        self.queue_size = hub.queue_size
+        self.block_on_full = block_on_full
+        self.preserve_record = preserve_record
+        self.caller_info = caller_info
+
+        # 리스너 (여러 로거가 공유 가능)
+        self.hub = hub
+        self.listener = hub.kind
+        self._attached = False
         self._start_listener()
 
         # 로거 설정
         self.logger = self._setup_logger()
+        self._is_enabled_for = self.logger.isEnabledFor
 
         # 자동 종료 등록
         atexit.register(self.shutdown)
 
     def _start_listener(self):
-        """로그 리스너 프로세스 시작"""
-        self.listener_process = Process(
-            target=_log_listener_process,
-            args=(
-                self.log_queue,
-                self.name,
-                self.log_dir,
-                self.log_level,
-                self.console_output,
-                self.file_output,
-                self.max_bytes,
-                self.backup_count,
-            ),
-            daemon=True,
-            name=f"LogListener-{self.name}",
+        """리스너에 이 로거의 출력 설정 등록 (리스너가 없으면 시작)"""
+        config = _AttachLogger(
+            self.name,
+            self.log_dir,
+            self.log_level,
+            self.console_output,
+            self.file_output,
+            self.max_bytes,
+            self.backup_count,
         )
-        self.listener_process.start()
+        self.hub.attach(config)
+        self._listener_key = config.key  # 레코드 라우팅 / 분리 시 사용
+        self._attached = True
+
+        # 연결 중에는 리스너가 유지되므로 큐/링 참조 고정
+        self.log_queue = self.hub.log_queue
+        self.log_ring: Optional[SharedRing] = self.hub.log_ring
+
+    @property
+    def listener_process(self) -> Optional[Process]:
+        """리스너 프로세스 (스레드 모드면 None)"""
+        return self.hub.worker if self.listener == "process" else None
 
     def _setup_logger(self) -> logging.Logger:
         """로거 설정 - 큐 핸들러만 사용"""
@@ -209,7 +355,14 @@ class AsyncLoggerCore:
         logger.propagate = False  # 부모 로거로 전파 방지
 
         # 큐 핸들러 추가
-        queue_handler = AsyncQueueHandler(self.log_queue)
+        queue_handler = AsyncQueueHandler(
+            self.log_queue,
+            self.log_ring,
+            block_on_full=self.block_on_full,
+            preserve_record=self.preserve_record,
+            local=self.listener == "thread",
+            target=self._listener_key,
+        )
         queue_handler.setLevel(self.log_level)
         logger.addHandler(queue_handler)
 
@@ -219,33 +372,65 @@ class AsyncLoggerCore:
 
     def debug(self, msg: str, *args, **kwargs):
         """DEBUG 레벨 로그"""
-        kwargs.setdefault("stacklevel", 2)
-        self.logger.debug(msg, *args, **kwargs)
+        if self._is_enabled_for(logging.DEBUG):
+            self._log(logging.DEBUG, msg, args, kwargs)
 
     def info(self, msg: str, *args, **kwargs):
         """INFO 레벨 로그"""
-        kwargs.setdefault("stacklevel", 2)
-        self.logger.info(msg, *args, **kwargs)
+        if self._is_enabled_for(logging.INFO):
+            self._log(logging.INFO, msg, args, kwargs)
 
     def warning(self, msg: str, *args, **kwargs):
         """WARNING 레벨 로그"""
-        kwargs.setdefault("stacklevel", 2)
-        self.logger.warning(msg, *args, **kwargs)
+        if self._is_enabled_for(logging.WARNING):
+            self._log(logging.WARNING, msg, args, kwargs)
 
     def error(self, msg: str, *args, **kwargs):
         """ERROR 레벨 로그"""
-        kwargs.setdefault("stacklevel", 2)
-        self.logger.error(msg, *args, **kwargs)
+        if self._is_enabled_for(logging.ERROR):
+            self._log(logging.ERROR, msg, args, kwargs)
 
     def critical(self, msg: str, *args, **kwargs):
         """CRITICAL 레벨 로그"""
-        kwargs.setdefault("stacklevel", 2)
-        self.logger.critical(msg, *args, **kwargs)
+        if self._is_enabled_for(logging.CRITICAL):
+            self._log(logging.CRITICAL, msg, args, kwargs)
 
     def exception(self, msg: str, *args, **kwargs):
         """예외 로그 (스택 트레이스 포함)"""
-        kwargs.setdefault("stacklevel", 2)
-        self.logger.exception(msg, *args, **kwargs)
+        if self._is_enabled_for(logging.ERROR):
+            kwargs.setdefault("exc_info", True)
+            self._log(logging.ERROR, msg, args, kwargs)
+
+    def _log(self, level: int, msg: str, args: tuple, kwargs: dict):
+        """레벨 메서드 공통 처리 (레벨 검사는 호출 측에서 완료)"""
+        if self.caller_info:
+            # 레벨 메서드 기준 stacklevel에 이 메서드 한 단계를 더함
+            kwargs["stacklevel"] = kwargs.get("stacklevel", 2) + 1
+            self.logger._log(level, msg, args, **kwargs)
+            return
+
+        # 호출 위치 없이 레코드 직접 생성 (findCaller 스택 탐색 생략)
+        exc_info = kwargs.get("exc_info")
+        if exc_info:
+            if isinstance(exc_info, BaseException):
+                exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+            elif not isinstance(exc_info, tuple):
+                exc_info = sys.exc_info()
+        else:
+            exc_info = None
+
+        record = self.logger.makeRecord(
+            self.logger.name,
+            level,
+            "(unknown file)",
+            0,
+            msg,
+            args,
+            exc_info,
+            "(unknown function)",
+            kwargs.get("extra"),
+        )
+        self.logger.handle(record)
 
     # ==================== Utility Methods ====================
 
@@ -261,26 +446,18 @@ class AsyncLoggerCore:
         return self.logger
 
     def is_alive(self) -> bool:
-        """리스너 프로세스 상태 확인"""
-        return self.listener_process is not None and self.listener_process.is_alive()
+        """리스너 스레드/프로세스 상태 확인"""
+        return self._attached and self.hub.is_alive()
 
     def shutdown(self):
-        """로그 코어 종료"""
-        if self.listener_process and self.listener_process.is_alive():
-            # 종료 신호 전송
-            try:
-                self.log_queue.put(None, timeout=1)
-            except:
-                pass
-
-            # 프로세스 종료 대기
-            self.listener_process.join(timeout=3)
+        """로그 코어 종료 (리스너에서 분리, 마지막 로거면 리스너도 종료)"""
+        if not self._attached:
+            return
 
-            # 강제 종료
-            if self.listener_process.is_alive():
-                self.listener_process.terminate()
-                self.listener_process.join(timeout=1)
+        self._attached = False
+        self.hub.detach(self._listener_key)
 
     def __del__(self):
-        """소멸자 - 자동 정리"""
-        self.shutdown()
+        """소멸자 - 자동 정리 (초기화에 실패한 객체는 제외)"""
+        if hasattr(self, "logger"):
+            self.shutdown()
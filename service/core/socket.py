@@ -4,18 +4,76 @@ TCP Socket Core Implementation
 TCP 소켓 핵심 구현 (Observer 패턴 포함)
 """
 
+import logging
+import random
+import selectors
 import socket
 import threading
-import queue
-from typing import Optional, List, Any, Dict
+from collections import deque
+from typing import Optional, List, Any, Dict, Tuple, Deque, Callable, Iterator
+from contextlib import contextmanager
+from functools import partial
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 import time
 import json
 import struct
 
+try:
+    import orjson
 
-@dataclass
+    _json_loads = orjson.loads
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    _json_loads = json.loads
+
+log = logging.getLogger(__name__)
+
+
+# ==================== Clock ====================
+
+# 수신 시각 함수 (기본: 호출마다 시스템 시계 조회)
+_now = time.time
+
+
+class _CoarseClock:
+    """주기적으로 갱신되는 캐시 시각 (읽을 때 시스템 시계를 조회하지 않음)"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.now = time.time()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._tick, name="CoarseClock", daemon=True)
+        self._thread.start()
+
+    def _tick(self):
+        while not self._stop_event.wait(self.interval):
+            self.now = time.time()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def stop(self):
+        self._stop_event.set()
+
+
+def use_coarse_clock(enabled: bool = True, interval: float = 0.001):
+    """
+    수신 시각을 캐시 시각으로 기록할지 설정
+
+    캐시 시각은 interval 주기로 갱신되므로 최대 interval만큼 오차가 있음
+    (갱신 스레드가 GIL을 주기적으로 점유하므로 초당 수신량이 많을 때만 권장)
+
+    Args:
+        enabled: True면 캐시 시각, False면 시스템 시계 직접 조회
+        interval: 캐시 갱신 주기 (초)
+    """
+    global _now
+    if isinstance(_now, _CoarseClock):
+        _now.stop()
+    _now = _CoarseClock(interval) if enabled else time.time
+
+
+@dataclass(slots=True)
 class SocketMessage:
     """수신된 소켓 메시지"""
 
@@ -24,7 +82,7 @@ class SocketMessage:
     timestamp: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedMessage:
     """파싱된 메시지 데이터"""
 
@@ -34,6 +92,60 @@ class ParsedMessage:
     timestamp: float
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    # 풀 참조 수 (0이면 풀 관리 대상 아님 - 일반 생성 메시지)
+    _refs: int = field(default=0, init=False, repr=False, compare=False)
+
+    @classmethod
+    def acquire(
+        cls,
+        message_type: str,
+        payload: Any,
+        raw_data: bytes,
+        timestamp: float,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> "ParsedMessage":
+        """
+        풀에서 메시지를 꺼내 채움 (없으면 새로 생성, 참조 수 1)
+
+        release()로 참조 수가 0이 되면 풀로 돌아가 재사용되므로
+        알림 이후에도 메시지 객체를 보관하는 리스너는 retain()을 호출해야 함
+        """
+        try:
+            msg = _MESSAGE_POOL.pop()
+        except IndexError:
+            msg = cls(message_type, payload, raw_data, timestamp, {} if metadata is None else metadata)
+        else:
+            msg.message_type = message_type
+            msg.payload = payload
+            msg.raw_data = raw_data
+            msg.timestamp = timestamp
+            msg.metadata = {} if metadata is None else metadata
+        msg._refs = 1
+        return msg
+
+    def retain(self):
+        """메시지 보관 (풀 메시지의 참조 수 증가, 일반 메시지는 무시)"""
+        if self._refs:
+            self._refs += 1
+
+    def release(self):
+        """참조 해제 (풀 메시지의 참조 수가 0이 되면 내용을 비우고 풀에 반환)"""
+        if not self._refs:
+            return
+        self._refs -= 1
+        if self._refs:
+            return
+
+        # 내용 참조를 끊어 페이로드가 풀에 묶이지 않도록 함 (_refs=0 상태로 보관)
+        self.payload = self.raw_data = self.metadata = None
+        if len(_MESSAGE_POOL) < _MESSAGE_POOL_SIZE:
+            _MESSAGE_POOL.append(self)
+
+
+# 재사용 대기 중인 ParsedMessage (pool_messages=True인 클라이언트가 사용)
+_MESSAGE_POOL: List[ParsedMessage] = []
+_MESSAGE_POOL_SIZE = 1024
+
 
 # ==================== Observer Pattern ====================
 
@@ -56,142 +168,355 @@ class SocketDataListener(ABC):
         """에러 발생 콜백"""
         pass
 
+    def on_data_batch(self, messages: List[ParsedMessage]):
+        """
+        데이터 일괄 수신 콜백 (기본 구현: 메시지마다 on_data_received 호출)
+
+        여러 메시지를 한 번에 처리할 수 있는 리스너는 재정의하여 호출 횟수를 줄임
+        """
+        for data in messages:
+            self.on_data_received(data)
+
 
 class SocketObserver:
     """옵저버 패턴 구현 - 리스너 관리"""
 
     def __init__(self):
-        self._listeners: List[SocketDataListener] = []
-        self._lock = threading.Lock()
+        # 등록된 리스너 (id -> 리스너, 등록 순서 유지) - 등록/제거 확인 O(1)
+        self._listeners: Dict[int, SocketDataListener] = {}
+        self._lock = threading.Lock()  # attach/detach 간 직렬화용
+
+        # 알림 종류별 바운드 메서드 튜플 (통째로 교체 - 알림 경로는 락 없이 읽기)
+        self._on_data: Tuple[Tuple[Callable, Callable], ...] = ()
+        self._on_conn: Tuple[Callable, ...] = ()
+        self._on_err: Tuple[Callable, ...] = ()
+
+        # 일괄 알림 콜백 (재정의한 on_data_batch 또는 None, on_data_received, on_error)
+        self._on_batch: Tuple[Tuple[Optional[Callable], Callable, Callable], ...] = ()
+
+        # 일괄 알림 모드 - begin_batch()~end_batch() 사이의 notify_data를 모아 한 번에 전달
+        self._batch: Optional[List[ParsedMessage]] = None
+        self._batch_depth = 0
 
     def attach(self, listener: SocketDataListener):
         """리스너 등록"""
         with self._lock:
-            if listener not in self._listeners:
-                self._listeners.append(listener)
-                print(f"리스너 등록: {listener.__class__.__name__}")
+            key = id(listener)
+            if key not in self._listeners:
+                self._listeners[key] = listener
+                self._publish()
 
     def detach(self, listener: SocketDataListener):
         """리스너 제거"""
         with self._lock:
-            if listener in self._listeners:
-                self._listeners.remove(listener)
-                print(f"리스너 제거: {listener.__class__.__name__}")
+            if self._listeners.pop(id(listener), None) is not None:
+                self._publish()
+
+    def _publish(self):
+        """등록된 리스너로 콜백 튜플 교체 (락 보유 상태에서 호출, copy-on-write)"""
+        listeners = tuple(self._listeners.values())
+        self._on_data = tuple((l.on_data_received, l.on_error) for l in listeners)
+        self._on_conn = tuple(l.on_connection_changed for l in listeners)
+        self._on_err = tuple(l.on_error for l in listeners)
+        self._on_batch = tuple(
+            (
+                l.on_data_batch
+                if type(l).on_data_batch is not SocketDataListener.on_data_batch
+                else None,
+                l.on_data_received,
+                l.on_error,
+            )
+            for l in listeners
+        )
 
     def notify_data(self, data: ParsedMessage):
-        """모든 리스너에게 데이터 전달"""
-        with self._lock:
-            listeners = self._listeners.copy()
-
-        for listener in listeners:
+        """모든 리스너에게 데이터 전달 (일괄 알림 모드면 모아 두었다가 end_batch()에서 전달)"""
+        if self._batch is not None:
+            # end_batch()가 다른 스레드에서 목록을 가져가는 중일 수 있으므로 락 안에서 다시 확인 후 추가
+            # (일괄 모드가 아니면 락 없이 바로 전달)
+            with self._lock:
+                batch = self._batch
+                if batch is not None:
+                    data.retain()  # end_batch()에서 전달 후 해제
+                    batch.append(data)
+                    return
+
+        callbacks = self._on_data
+        if not callbacks:
+            return
+        for on_data, on_error in callbacks:
             try:
-                listener.on_data_received(data)
+                on_data(data)
             except Exception as e:
-                print(f"리스너 에러 ({listener.__class__.__name__}): {e}")
+                log.error("리스너 에러 (%s): %s", _owner_name(on_data), e)
                 try:
-                    listener.on_error(e)
+                    on_error(e)
                 except:
                     pass
 
-    def notify_connection(self, connected: bool):
-        """연결 상태 변경 알림"""
+    def notify_batch(self, messages: List[ParsedMessage]):
+        """
+        여러 메시지를 리스너마다 한 번에 전달
+
+        on_data_batch를 재정의한 리스너는 목록 전체로 한 번 호출하고,
+        나머지 리스너는 메시지마다 on_data_received 호출 (메시지 단위 에러 격리 유지)
+        """
+        callbacks = self._on_batch
+        if not callbacks or not messages:
+            return
+        for on_batch, on_data, on_error in callbacks:
+            if on_batch is not None:
+                try:
+                    on_batch(messages)
+                except Exception as e:
+                    log.error("리스너 에러 (%s): %s", _owner_name(on_batch), e)
+                    try:
+                        on_error(e)
+                    except:
+                        pass
+                continue
+
+            for data in messages:
+                try:
+                    on_data(data)
+                except Exception as e:
+                    log.error("리스너 에러 (%s): %s", _owner_name(on_data), e)
+                    try:
+                        on_error(e)
+                    except:
+                        pass
+
+    def begin_batch(self):
+        """일괄 알림 시작 (중첩 가능 - 가장 바깥 end_batch()에서 전달)"""
+        with self._lock:
+            if self._batch_depth == 0:
+                self._batch = []
+            self._batch_depth += 1
+
+    def end_batch(self):
+        """일괄 알림 종료 - 모아 둔 메시지를 notify_batch()로 전달"""
         with self._lock:
-            listeners = self._listeners.copy()
+            if self._batch_depth == 0:
+                return
+            self._batch_depth -= 1
+            if self._batch_depth:
+                return
+            messages = self._batch
+            self._batch = None
+
+        self.notify_batch(messages)
+        for data in messages:
+            data.release()
+
+    @contextmanager
+    def batch(self) -> Iterator["SocketObserver"]:
+        """
+        일괄 알림 컨텍스트
+
+        Example:
+            with observer.batch():
+                for msg in messages:
+                    observer.notify_data(msg)
+        """
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
 
-        for listener in listeners:
+    def notify_connection(self, connected: bool):
+        """연결 상태 변경 알림"""
+        callbacks = self._on_conn
+        if not callbacks:
+            return
+        for on_conn in callbacks:
             try:
-                listener.on_connection_changed(connected)
+                on_conn(connected)
             except Exception as e:
-                print(f"연결 상태 알림 에러 ({listener.__class__.__name__}): {e}")
+                log.error("연결 상태 알림 에러 (%s): %s", _owner_name(on_conn), e)
 
     def notify_error(self, error: Exception):
         """에러 알림"""
-        with self._lock:
-            listeners = self._listeners.copy()
-
-        for listener in listeners:
+        callbacks = self._on_err
+        if not callbacks:
+            return
+        for on_err in callbacks:
             try:
-                listener.on_error(error)
+                on_err(error)
             except Exception as e:
-                print(f"에러 알림 실패 ({listener.__class__.__name__}): {e}")
+                log.error("에러 알림 실패 (%s): %s", _owner_name(on_err), e)
+
+    def has_data_listeners(self) -> bool:
+        """데이터를 받을 리스너가 있는지 여부 (락 없이 조회)"""
+        return bool(self._on_data)
 
     def listener_count(self) -> int:
         """등록된 리스너 수"""
-        with self._lock:
-            return len(self._listeners)
+        return len(self._listeners)
+
+
+def _owner_name(callback: Callable) -> str:
+    """바운드 메서드의 리스너 클래스 이름 (에러 메시지용)"""
+    return getattr(callback, "__self__", callback).__class__.__name__
 
 
 # ==================== Data Parser ====================
 
+# JSON 메시지 시작 바이트 ('{', '[')
+_JSON_MARKERS = frozenset(b"{[")
 
-class DataParser:
-    """데이터 파서 - 프로토콜에 맞게 커스터마이징 가능"""
+# JSON 앞에 올 수 있는 공백 (줄 단위 JSON에서 청크가 줄바꿈 뒤에서 나뉜 경우 등)
+_JSON_WHITESPACE = b" \t\r\n"
 
-    @staticmethod
-    def parse(data: bytes) -> ParsedMessage:
-        """
-        데이터 파싱 (기본 구현 - JSON 기반)
+# 바이너리 헤더: [4 bytes: length][1 byte: type]
+_HDR = struct.Struct(">IB")
 
-        프로토콜 형식:
-        [4 bytes: length][1 byte: type][N bytes: payload]
-        """
-        try:
-            # 간단한 JSON 파싱 시도
-            try:
-                decoded = data.decode("utf-8")
-                payload = json.loads(decoded)
-                msg_type = payload.get("type", "unknown")
+# 타입 코드 -> 메시지 타입 문자 (수신마다 chr() 호출 없이 조회)
+_TYPE_CHARS: Tuple[str, ...] = tuple(chr(code) for code in range(256))
 
-                return ParsedMessage(
-                    message_type=msg_type,
-                    payload=payload,
-                    raw_data=data,
-                    timestamp=time.time(),
-                )
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                pass
 
-            # 바이너리 프로토콜 파싱
-            if len(data) >= 5:
-                length = struct.unpack(">I", data[:4])[0]
-                msg_type = chr(data[4])
-                payload_data = data[5 : 5 + length]
+def _looks_like_json(data: bytes) -> bool:
+    """앞 공백을 건너뛴 첫 바이트가 '{' 또는 '['인지 확인"""
+    if not data:
+        return False
+    head = data[0]
+    if head in _JSON_MARKERS:
+        return True
+    if head not in _JSON_WHITESPACE:
+        return False
+    data = data.lstrip(_JSON_WHITESPACE)
+    return bool(data) and data[0] in _JSON_MARKERS
 
-                # 페이로드 파싱 시도
-                try:
-                    payload = json.loads(payload_data.decode("utf-8"))
-                except:
-                    payload = payload_data
 
-                return ParsedMessage(
+def parse_message(
+    data: bytes, make: Callable[..., ParsedMessage] = ParsedMessage
+) -> ParsedMessage:
+    """
+    데이터 파싱 (기본 구현 - 첫 바이트로 JSON/바이너리 구분)
+
+    프로토콜 형식:
+    [4 bytes: length][1 byte: type][N bytes: payload]
+
+    Args:
+        data: 수신 데이터
+        make: 메시지 생성 함수 (ParsedMessage.acquire면 풀에서 재사용)
+    """
+    try:
+        # JSON은 (앞 공백을 제외하고) '{' 또는 '['로 시작하는 경우에만 시도
+        if _looks_like_json(data):
+            try:
+                # bytes를 그대로 파싱 (디코딩 복사 없음)
+                payload: Any = _json_loads(data)
+                if isinstance(payload, dict):
+                    msg_type = payload.get("type", "unknown")
+                else:
+                    msg_type = "unknown"
+
+                return make(
                     message_type=msg_type,
                     payload=payload,
                     raw_data=data,
-                    timestamp=time.time(),
-                    metadata={"protocol": "binary", "length": length},
+                    timestamp=_now(),
                 )
+            except ValueError:
+                pass
 
-            # 단순 텍스트
-            return ParsedMessage(
-                message_type="text",
-                payload=data.decode("utf-8", errors="ignore"),
-                raw_data=data,
-                timestamp=time.time(),
-            )
+        # 바이너리 프로토콜 파싱
+        if len(data) >= 5:
+            length: int
+            type_code: int
+            length, type_code = _HDR.unpack_from(data)
+            msg_type = _TYPE_CHARS[type_code]
+            payload_data: bytes = data[5 : 5 + length]
+
+            # 페이로드 파싱 시도
+            payload = payload_data
+            if _looks_like_json(payload_data):
+                try:
+                    payload = _json_loads(payload_data)
+                except ValueError:
+                    pass
 
-        except Exception as e:
-            # 파싱 실패 시 raw 데이터로 처리
-            return ParsedMessage(
-                message_type="raw",
-                payload=data,
+            return make(
+                message_type=msg_type,
+                payload=payload,
                 raw_data=data,
-                timestamp=time.time(),
-                metadata={"error": str(e)},
+                timestamp=_now(),
+                metadata={"protocol": "binary", "length": length},
             )
 
+        # 단순 텍스트
+        return make(
+            message_type="text",
+            payload=data.decode("utf-8", errors="ignore"),
+            raw_data=data,
+            timestamp=_now(),
+        )
+
+    except Exception as e:
+        # 파싱 실패 시 raw 데이터로 처리
+        return make(
+            message_type="raw",
+            payload=data,
+            raw_data=data,
+            timestamp=_now(),
+            metadata={"error": str(e)},
+        )
+
+
+class DataParser:
+    """데이터 파서 - 프로토콜에 맞게 커스터마이징 가능 (기본 구현은 parse_message)"""
+
+    parse = staticmethod(parse_message)
+
 
 # ==================== TCP Client Core ====================
 
+# 지원하는 수신 프레임 단위
+_FRAMINGS = (None, "length", "line")
+
+# 바이너리 프레임 헤더 크기 (파서와 같은 헤더)
+_FRAME_HEADER_SIZE = _HDR.size
+
+# 프레임 재조립 버퍼 최소 크기
+_RX_BUFFER_SIZE = 64 * 1024
+
+# 백그라운드 모드 수신 버퍼 풀 최대 개수
+_RX_POOL_SIZE = 64
+
+# reconnect_min만 지정했을 때의 재연결 대기 최대 상한 (초)
+_RECONNECT_MAX_DEFAULT = 60.0
+
+
+class _Stats:
+    """클라이언트 통계 (슬롯 속성 - 수신마다 딕셔너리 해시 조회 없음)"""
+
+    __slots__ = ("connected", "total_received", "total_bytes", "last_received")
+
+    def __init__(self):
+        self.connected: bool = False
+        self.total_received: int = 0
+        self.total_bytes: int = 0
+        self.last_received: Optional[float] = None
+
+    def as_dict(self) -> Dict:
+        """통계 딕셔너리 반환 (각 값은 단일 속성 읽기 - 락 없이 스냅샷)"""
+        return {
+            "connected": self.connected,
+            "total_received": self.total_received,
+            "total_bytes": self.total_bytes,
+            "last_received": self.last_received,
+        }
+
+
+def _drain_wake(wake_r: socket.socket):
+    """쌓인 깨우기 신호 비우기"""
+    try:
+        while wake_r.recv(64):
+            pass
+    except OSError:
+        pass
+
 
 class TCPClient:
     """TCP 클라이언트 핵심 구현"""
@@ -204,6 +529,13 @@ class TCPClient:
         auto_reconnect: bool = True,
         reconnect_interval: float = 5.0,
         buffer_size: int = 4096,
+        use_background_parse: bool = False,
+        backlog_size: int = 10000,
+        framing: Optional[str] = None,
+        reconnect_min: Optional[float] = None,
+        reconnect_max: Optional[float] = None,
+        pool_messages: bool = False,
+        max_frame_size: Optional[int] = None,
     ):
         """
         TCP 클라이언트 초기화
@@ -213,51 +545,119 @@ class TCPClient:
             port: 포트 번호
             observer: 옵저버 객체
             auto_reconnect: 자동 재연결 여부
-            reconnect_interval: 재연결 시도 간격 (초)
+            reconnect_interval: 재연결 시도 간격 (초, reconnect_min/max 미지정 시 사용)
             buffer_size: 수신 버퍼 크기
+            use_background_parse: 파싱/알림을 별도 스레드에서 처리할지 여부
+                (False면 수신 스레드에서 바로 처리)
+            backlog_size: 백그라운드 처리 대기 최대 개수 (초과 시 오래된 것부터 버림)
+            framing: 수신 프레임 단위
+                - None: recv() 청크 단위로 파싱
+                - "length": [4 bytes: length][1 byte: type][N bytes: payload] 프레임 단위로 파싱
+                - "line": 줄바꿈(\n)으로 구분된 메시지 단위로 파싱 (JSON Lines 등)
+            reconnect_min: 재연결 대기 시작 상한 (초, 실패할 때마다 2배씩 증가)
+            reconnect_max: 재연결 대기 최대 상한 (초)
+                (min < max면 0~상한 사이 무작위 대기, 같으면 고정 간격)
+                - 둘 다 None이면 reconnect_interval 고정 간격
+                - reconnect_min만 지정하면 최대 상한은 max(reconnect_min, 60초)
+                - reconnect_max만 지정하면 reconnect_interval부터 reconnect_max까지 증가
+            pool_messages: True면 ParsedMessage를 풀에서 재사용 (알림 후 반환되므로
+                메시지 객체를 보관하는 리스너는 retain() 호출 필요)
+            max_frame_size: framing 사용 시 한 메시지의 최대 크기 (바이트, None이면 재조립 버퍼 크기의 256배 - 기본 16MB)
+                - 넘으면 on_error로 알리고 연결을 끊음 (줄바꿈 없는 스트림 등으로 버퍼가 무한히 커지는 것 방지)
         """
+        if framing not in _FRAMINGS:
+            raise ValueError(f"지원하지 않는 framing: {framing}")
+
         self.host = host
         self.port = port
         self.observer = observer
         self.auto_reconnect = auto_reconnect
         self.reconnect_interval = reconnect_interval
+        self.reconnect_min = reconnect_interval if reconnect_min is None else reconnect_min
+        if reconnect_max is None:
+            # reconnect_min만 지정한 경우 reconnect_interval과 무관한 고정 상한 사용 (백오프 유지)
+            reconnect_max = reconnect_interval if reconnect_min is None else _RECONNECT_MAX_DEFAULT
+        self.reconnect_max = max(self.reconnect_min, reconnect_max)
+        self._backoff = self.reconnect_min  # 현재 재연결 대기 상한 (연결 성공 시 초기화)
         self.buffer_size = buffer_size
+        self.use_background_parse = use_background_parse
+        self.framing = framing
 
         # 스레드 간 통신 (Windows에서 빠른 시작)
-        self.data_queue = queue.Queue()
-        self.command_queue = queue.Queue()
+        # 백그라운드 파싱 모드에서만 사용하는 bounded 버퍼
+        self.data_queue: Optional[Deque[Tuple[str, Any]]] = (
+            deque(maxlen=backlog_size) if use_background_parse else None
+        )
+        self._data_ready = threading.Event()
+
+        # 제어 신호 (수신 루프에서 큐 폴링 없이 플래그만 확인)
         self.stop_event = threading.Event()
+        self._disconnect_event = threading.Event()
+
+        # 수신 대기 중인 selector를 깨우는 소켓 쌍 (start() 시 생성, 수신 스레드 종료 시 닫음)
+        self._wake_r: Optional[socket.socket] = None
+        self._wake_w: Optional[socket.socket] = None
+
+        # 연결 재사용 (adopt_socket()으로 받은 소켓 / stop(release_socket=True)로 돌려줄 소켓)
+        self._adopted_sock: Optional[socket.socket] = None
+        self._released_sock: Optional[socket.socket] = None
+        self._release_socket = False
 
         # TCP 루프 스레드
         self.tcp_thread: Optional[threading.Thread] = None
         self.running = False
 
-        # 파서
-        self.parser = DataParser()
+        # 파서 (기본 파서는 모듈 함수를 직접 호출)
+        self._parser: DataParser = DataParser()
+        self.pool_messages = pool_messages
+        self._parse: Callable[[bytes], ParsedMessage] = (
+            partial(parse_message, make=ParsedMessage.acquire) if pool_messages else parse_message
+        )
+
+        # 프레임 재조립 버퍼 (recv_into로 재사용)
+        self._rx_buf = bytearray(max(_RX_BUFFER_SIZE, buffer_size) if framing else 0)
+        self.max_frame_size = (
+            max(_RX_BUFFER_SIZE, buffer_size) * 256 if max_frame_size is None else max_frame_size
+        )
+        self._rx_fill = 0
+
+        # 백그라운드 모드 수신 버퍼 풀 (수신 스레드가 꺼내 쓰고 처리 스레드가 반환)
+        self._rx_pool: List[bytearray] = []
 
         # 통계
-        self.stats = {
-            "connected": False,
-            "total_received": 0,
-            "total_bytes": 0,
-            "last_received": None,
-        }
+        self.stats = _Stats()
 
         # 데이터 처리 스레드
         self.processor_thread: Optional[threading.Thread] = None
-        self.thread_stop_event = threading.Event()
+
+    @property
+    def parser(self) -> DataParser:
+        """수신 데이터 파서"""
+        return self._parser
+
+    @parser.setter
+    def parser(self, parser: DataParser):
+        """파서 교체 (parse 메서드를 미리 바인딩해 수신마다 속성 조회 없음)"""
+        self._parser = parser
+        self._parse = parser.parse
 
     def start(self):
         """클라이언트 시작"""
         if self.running:
-            print("이미 실행 중입니다.")
+            log.warning("이미 실행 중입니다.")
             return
 
         self.running = True
+        self._release_socket = False
 
-        # stop event 초기화
+        # 제어 신호 초기화
         self.stop_event.clear()
-        self.thread_stop_event.clear()
+        self._disconnect_event.clear()
+
+        # 깨우기 소켓 쌍 (stop/disconnect 시 1바이트 기록)
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
 
         # TCP 루프 스레드 시작 (Windows에서 빠른 시작)
         self.tcp_thread = threading.Thread(
@@ -266,125 +666,401 @@ class TCPClient:
             name="TCPLoop",
         )
         self.tcp_thread.start()
-        print(f"TCP 클라이언트 스레드 시작: {self.host}:{self.port}")
+        log.info("TCP 클라이언트 스레드 시작: %s:%s", self.host, self.port)
 
-        # 데이터 처리 스레드 시작
-        self.processor_thread = threading.Thread(
-            target=self._process_data, daemon=True, name="DataProcessor"
-        )
-        self.processor_thread.start()
-        print("데이터 처리 스레드 시작")
+        # 데이터 처리 스레드 시작 (백그라운드 파싱 모드)
+        if self.use_background_parse:
+            self.processor_thread = threading.Thread(
+                target=self._process_data, daemon=True, name="DataProcessor"
+            )
+            self.processor_thread.start()
+            log.debug("데이터 처리 스레드 시작")
 
     def _tcp_loop(self):
-        """TCP 연결 및 수신 루프 (별도 스레드에서 실행)"""
+        """TCP 연결 및 수신 루프 (별도 스레드에서 실행, 끝나면 selector와 깨우기 소켓 쌍을 닫음)"""
+        # 이 스레드가 시작될 때의 소켓 쌍 (재시작으로 교체되어도 자기 것만 닫음)
+        wake_r, wake_w = self._wake_r, self._wake_w
+
+        # select()와 달리 FD_SETSIZE(1024)를 넘는 디스크립터도 대기 가능 (Linux는 epoll)
+        selector = selectors.DefaultSelector()
+        selector.register(wake_r, selectors.EVENT_READ)
+        try:
+            self._recv_loop(selector, wake_r)
+        finally:
+            selector.close()
+            wake_r.close()
+            wake_w.close()
+        log.debug("TCP 루프 종료")
+
+    def _recv_loop(self, selector: selectors.BaseSelector, wake_r: socket.socket):
+        """연결/수신/재연결 반복 (중지 신호까지)"""
         sock = None
+        connected_now = False
 
         while not self.stop_event.is_set():
+            reusable = False  # stop()으로 끝난 정상 연결이면 True (소켓 반환 가능)
             try:
-                # 연결 시도
-                print(f"[스레드] {self.host}:{self.port} 연결 시도...")
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(5.0)
-                sock.connect((self.host, self.port))
-                sock.settimeout(0.1)
+                # 넘겨받은 연결이 있으면 재사용, 없으면 연결 시도
+                sock, self._adopted_sock = self._adopted_sock, None
+                if sock is None:
+                    log.info("%s:%s 연결 시도...", self.host, self.port)
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    sock.settimeout(5.0)
+                    sock.connect((self.host, self.port))
+                sock.settimeout(None)  # 수신 대기는 selector로 처리 (타임아웃 폴링 없음)
+                selector.register(sock, selectors.EVENT_READ)
+                self._backoff = self.reconnect_min
 
                 # 연결 성공 알림
-                self.data_queue.put(("connection", True))
-                print(f"[스레드] 연결 성공: {self.host}:{self.port}")
+                connected_now = True
+                self._rx_fill = 0
+                self._emit("connection", True)
+                log.info("연결 성공: %s:%s", self.host, self.port)
+
+                # 청크 단위 수신 버퍼 (연결마다 한 번 할당 후 recv_into로 재사용)
+                rx_view = memoryview(bytearray(self.buffer_size))
 
                 # 수신 루프
                 while not self.stop_event.is_set():
-                    # 명령 확인
-                    try:
-                        cmd = self.command_queue.get_nowait()
-                        if cmd == "stop":
-                            break
-                        elif cmd == "disconnect":
-                            print("[스레드] 연결 종료 명령 수신")
-                            break
-                    except:
-                        pass
+                    # 연결 종료 요청 확인
+                    if self._disconnect_event.is_set():
+                        self._disconnect_event.clear()
+                        log.info("연결 종료 명령 수신")
+                        break
 
                     # 데이터 수신
                     try:
-                        data = sock.recv(self.buffer_size)
-                        if not data:
-                            print("[스레드] 서버 연결 종료")
+                        # 소켓 또는 깨우기 신호 대기 (유휴 시 주기적 깨어남 없음)
+                        if any(key.fileobj is wake_r for key, _ in selector.select()):
+                            _drain_wake(wake_r)
+                            continue
+
+                        # 프레임 단위 수신
+                        if self.framing:
+                            if not self._recv_frames(sock):
+                                log.info("서버 연결 종료")
+                                break
+                            continue
+
+                        # 백그라운드 모드 - 풀 버퍼에 받아 처리 스레드로 전달
+                        if self.data_queue is not None:
+                            if not self._recv_pooled(sock):
+                                log.info("서버 연결 종료")
+                                break
+                            continue
+
+                        received = sock.recv_into(rx_view)
+                        if not received:
+                            log.info("서버 연결 종료")
                             break
 
-                        # 데이터 전송
-                        self.data_queue.put(("data", data))
+                        # 수신 스레드에서 바로 파싱/알림 (수신 크기만큼만 복사)
+                        self._on_data(rx_view[:received].tobytes())
 
                     except socket.timeout:
                         continue
+                    except ValueError as e:
+                        # 프로토콜 에러 (프레임 크기 초과 등) - 알리고 연결 끊음
+                        log.warning("프로토콜 에러: %s", e)
+                        self._emit("error", str(e))
+                        break
                     except Exception as e:
-                        print(f"[스레드] 수신 에러: {e}")
+                        log.warning("수신 에러: %s", e)
                         break
+                else:
+                    # 중지 신호로 끝남 - 프레임 단위 수신이고 프레임 경계에서 멈췄으면 연결을 다시 쓸 수 있음
+                    # (청크 단위 수신은 메시지 경계를 알 수 없으므로 반환하지 않음)
+                    reusable = self.framing is not None and self._rx_fill == 0
 
             except Exception as e:
-                print(f"[스레드] 연결 에러: {e}")
-                self.data_queue.put(("connection", False))
-                self.data_queue.put(("error", str(e)))
+                log.warning("연결 에러: %s", e)
+                self._emit("error", str(e))
 
             finally:
-                # 소켓 정리
+                # 소켓 정리 (반환 요청이 있으면 닫지 않고 넘겨줌)
                 if sock:
                     try:
-                        sock.close()
-                    except:
-                        pass
+                        selector.unregister(sock)
+                    except (KeyError, ValueError):
+                        pass  # 연결 전에 실패한 경우
+                    if reusable and self._release_socket:
+                        self._released_sock = sock
+                    else:
+                        try:
+                            sock.close()
+                        except:
+                            pass
                     sock = None
 
-                # 연결 끊김 알림
-                self.data_queue.put(("connection", False))
+                # 연결 끊김 알림 (연결됐던 경우에만 한 번)
+                if connected_now:
+                    connected_now = False
+                    self._emit("connection", False)
 
             # 재연결 시도
             if not self.stop_event.is_set() and self.auto_reconnect:
-                print(f"[스레드] {self.reconnect_interval}초 후 재연결 시도...")
-                # 재연결 대기 중에도 stop_event 확인
-                for _ in range(int(self.reconnect_interval * 10)):
-                    if self.stop_event.is_set():
-                        break
-                    time.sleep(0.1)
+                delay = self._next_reconnect_delay()
+                log.info("%.2f초 후 재연결 시도...", delay)
+                # 재연결 대기 (stop 시 즉시 깨어남)
+                self.stop_event.wait(delay)
             else:
                 break
 
-        print("[스레드] TCP 루프 종료")
+    def _next_reconnect_delay(self) -> float:
+        """
+        다음 재연결 대기 시간 (지수 백오프 + 전체 지터)
 
-    def _process_data(self):
-        """데이터 처리 루프 (별도 스레드)"""
-        while not self.thread_stop_event.is_set():
-            try:
-                # 큐에서 데이터 가져오기
-                msg_type, data = self.data_queue.get(timeout=0.1)
+        여러 클라이언트가 같은 주기로 동시에 재연결하지 않도록 0~상한 사이에서 무작위로 고름
+        """
+        if self.reconnect_min >= self.reconnect_max:
+            return self.reconnect_min
 
-                if msg_type == "data":
-                    # 데이터 파싱
-                    parsed = self.parser.parse(data)
+        backoff = self._backoff
+        self._backoff = min(backoff * 2, self.reconnect_max)
+        return random.uniform(0, backoff)
 
-                    # 통계 업데이트
-                    self.stats["total_received"] += 1
-                    self.stats["total_bytes"] += len(data)
-                    self.stats["last_received"] = time.time()
+    def _wake(self):
+        """수신 스레드의 selector 대기를 깨움"""
+        wake_w = self._wake_w
+        if wake_w is None:
+            return
+        try:
+            wake_w.send(b"\0")
+        except OSError:
+            pass  # 버퍼가 가득 찬 경우 (이미 깨우기 신호가 대기 중) 또는 수신 스레드가 끝나 닫힌 경우
 
-                    # 옵저버에게 알림
-                    self.observer.notify_data(parsed)
+    def _recv_frames(self, sock: socket.socket) -> int:
+        """
+        재사용 버퍼에 recv_into 후 완성된 프레임 전달
 
-                elif msg_type == "connection":
-                    connected = data
-                    self.stats["connected"] = connected
-                    self.observer.notify_connection(connected)
+        Returns:
+            int: 수신 바이트 수 (0이면 연결 종료)
+        """
+        # 버퍼보다 큰 프레임 - 버퍼 확장 (최대 프레임 크기까지)
+        if self._rx_fill == len(self._rx_buf):
+            limit = self.max_frame_size + _FRAME_HEADER_SIZE
+            if self._rx_fill >= limit:
+                raise ValueError(f"프레임 크기 초과: {self._rx_fill} bytes (max_frame_size={self.max_frame_size})")
+            self._rx_buf.extend(bytes(min(len(self._rx_buf), limit - self._rx_fill)))
+
+        with memoryview(self._rx_buf) as view:
+            received = sock.recv_into(view[self._rx_fill :])
+
+        if received:
+            self._rx_fill += received
+            self._extract_frames()
+        return received
+
+    def _extract_frames(self):
+        """재조립 버퍼에서 완성된 프레임을 잘라 전달하고 남은 바이트를 앞으로 이동"""
+        buf = self._rx_buf
+        fill = self._rx_fill
+        pos = 0
+        frames = []
+        error = None
+
+        with memoryview(buf) as view:
+            if self.framing == "line":
+                # 줄바꿈까지 한 메시지 (줄바꿈 제외, 빈 줄은 무시)
+                while True:
+                    end = buf.find(b"\n", pos, fill)
+                    if end < 0:
+                        break
+                    if end > pos:
+                        frames.append(view[pos:end].tobytes())
+                    pos = end + 1
+            else:
+                while fill - pos >= _FRAME_HEADER_SIZE:
+                    length = _HDR.unpack_from(buf, pos)[0]
+                    if length > self.max_frame_size:
+                        # 잘못되거나 악의적인 길이 헤더 - 프레임을 기다리며 버퍼링하지 않고 거부
+                        # (앞서 완성된 프레임은 전달한 뒤 에러)
+                        error = ValueError(
+                            f"프레임 길이 헤더 초과: {length} bytes (max_frame_size={self.max_frame_size})"
+                        )
+                        break
+                    end = pos + _FRAME_HEADER_SIZE + length
+                    if end > fill:
+                        break
+                    frames.append(view[pos:end].tobytes())
+                    pos = end
 
-                elif msg_type == "error":
-                    error = Exception(data)
-                    self.observer.notify_error(error)
+        if pos:
+            remaining = fill - pos
+            buf[:remaining] = buf[pos:fill]
+            self._rx_fill = remaining
 
-            except queue.Empty:
+        for frame in frames:
+            if self.data_queue is not None:
+                self._emit("data", frame)
+            else:
+                self._on_data(frame)
+
+        if error is not None:
+            raise error
+
+    def _recv_pooled(self, sock: socket.socket) -> int:
+        """
+        풀 버퍼에 recv_into 후 (버퍼, 길이)를 처리 스레드로 전달 (수신 스레드 할당 없음)
+
+        Returns:
+            int: 수신 바이트 수 (0이면 연결 종료)
+        """
+        pool = self._rx_pool
+        buf = pool.pop() if pool else bytearray(self.buffer_size)
+        try:
+            received = sock.recv_into(buf)
+        except BaseException:
+            self._release_buffer(buf)
+            raise
+
+        if received:
+            self._emit("chunk", (buf, received))
+        else:
+            self._release_buffer(buf)
+        return received
+
+    def _release_buffer(self, buf: bytearray):
+        """수신 버퍼를 풀에 반환 (풀이 가득 차면 버림)"""
+        if len(self._rx_pool) < _RX_POOL_SIZE:
+            self._rx_pool.append(buf)
+
+    def _emit(self, msg_type: str, data: Any):
+        """이벤트 전달 (백그라운드 모드면 버퍼에 추가, 아니면 즉시 처리)"""
+        if self.data_queue is not None:
+            self.data_queue.append((msg_type, data))
+            self._data_ready.set()
+            return
+
+        try:
+            self._handle_event(msg_type, data)
+        except Exception as e:
+            log.error("데이터 처리 에러: %s", e)
+
+    def _on_data(self, data: bytes):
+        """수신 데이터 파싱 및 옵저버 알림"""
+        try:
+            stats = self.stats
+
+            # 리스너가 없으면 파싱 생략 (통계만 갱신)
+            if not self.observer.has_data_listeners():
+                stats.total_received += 1
+                stats.total_bytes += len(data)
+                stats.last_received = _now()
+                return
+
+            # 데이터 파싱
+            parsed = self._parse(data)
+
+            # 통계 업데이트
+            stats.total_received += 1
+            stats.total_bytes += len(data)
+            stats.last_received = parsed.timestamp  # 파서가 기록한 수신 시각 재사용
+
+            # 옵저버에게 알림
+            self.observer.notify_data(parsed)
+            if self.pool_messages:
+                parsed.release()
+        except Exception as e:
+            log.error("데이터 처리 에러: %s", e)
+
+    def _handle_event(self, msg_type: str, data: Any):
+        """이벤트 종류별 처리"""
+        if msg_type == "chunk":
+            self._on_data(self._take_chunk(data))
+
+        elif msg_type == "data":
+            self._on_data(data)
+
+        elif msg_type == "connection":
+            connected = data
+            self.stats.connected = connected
+            self.observer.notify_connection(connected)
+
+        elif msg_type == "error":
+            error = Exception(data)
+            self.observer.notify_error(error)
+
+    def _take_chunk(self, data: Tuple[bytearray, int]) -> bytes:
+        """풀 버퍼에서 수신 크기만큼 복사 후 버퍼 반환 (ParsedMessage가 raw_data를 보관하므로)"""
+        buf, size = data
+        with memoryview(buf) as view:
+            chunk = view[:size].tobytes()
+        self._release_buffer(buf)
+        return chunk
+
+    def _process_data(self):
+        """데이터 처리 루프 (백그라운드 파싱 모드 전용 스레드)"""
+        data_queue = self.data_queue
+        stats = self.stats
+
+        while not self.stop_event.is_set():
+            # 새 이벤트 대기
+            if not self._data_ready.wait(timeout=0.1):
                 continue
-            except Exception as e:
-                print(f"데이터 처리 에러: {e}")
+            self._data_ready.clear()
+
+            # 쌓인 이벤트를 한 번에 꺼냄 (수신 스레드는 계속 뒤에 추가)
+            batch = [data_queue.popleft() for _ in range(len(data_queue))]
+
+            # 배치 단위로 파서/알림 함수 조회, 통계는 배치 끝에서 한 번 갱신
+            parse = self._parse
+            notify_batch = self.observer.notify_batch
+            has_listeners = self.observer.has_data_listeners()
+            messages: List[ParsedMessage] = []
+            received = 0
+            received_bytes = 0
+            last_received = None
+
+            for msg_type, data in batch:
+                try:
+                    if msg_type == "chunk":
+                        data = self._take_chunk(data)
+                    elif msg_type != "data":
+                        # 순서 유지 - 모아 둔 메시지를 먼저 전달
+                        if messages:
+                            self._deliver_batch(notify_batch, messages)
+                            messages = []
+                        self._handle_event(msg_type, data)
+                        continue
+
+                    received += 1
+                    received_bytes += len(data)
+
+                    # 리스너가 없으면 파싱 생략 (통계만 갱신)
+                    if not has_listeners:
+                        continue
+
+                    parsed = parse(data)
+                    last_received = parsed.timestamp
+                    messages.append(parsed)
+                except Exception as e:
+                    log.error("데이터 처리 에러: %s", e)
 
-        print("데이터 처리 스레드 종료")
+            # 리스너마다 한 번에 전달 (on_data_batch 재정의 리스너는 호출 1회)
+            if messages:
+                self._deliver_batch(notify_batch, messages)
+
+            if received:
+                stats.total_received += received
+                stats.total_bytes += received_bytes
+                # 파서가 기록한 수신 시각 재사용 (파싱을 생략했으면 현재 시각)
+                stats.last_received = last_received or _now()
+
+        log.debug("데이터 처리 스레드 종료")
+
+    def _deliver_batch(
+        self,
+        notify_batch: Callable[[List[ParsedMessage]], None],
+        messages: List[ParsedMessage],
+    ):
+        """메시지 일괄 알림 후 풀 메시지 반환"""
+        try:
+            notify_batch(messages)
+        finally:
+            if self.pool_messages:
+                for parsed in messages:
+                    parsed.release()
 
     def send(self, data: bytes):
         """데이터 전송 (현재는 수신 전용, 필요시 구현 가능)"""
@@ -393,28 +1069,45 @@ class TCPClient:
 
     def disconnect(self):
         """연결 종료 (재연결 중지)"""
-        try:
-            self.command_queue.put_nowait("disconnect")
-        except:
-            pass
+        self._disconnect_event.set()
+        self._wake()
 
-    def stop(self):
-        """클라이언트 중지"""
-        if not self.running:
-            return
+    def adopt_socket(self, sock: socket.socket):
+        """
+        이미 연결된 소켓을 첫 연결로 사용 (start() 전에 호출, 연결 재사용용)
+
+        Args:
+            sock: 같은 host:port에 연결된 소켓
+        """
+        self._adopted_sock = sock
+
+    def stop(self, release_socket: bool = False) -> Optional[socket.socket]:
+        """
+        클라이언트 중지
 
-        print("TCP 클라이언트 중지 중...")
+        Args:
+            release_socket: True면 연결을 닫지 않고 반환 (연결 재사용용)
+
+        Returns:
+            release_socket=True이고 연결을 그대로 쓸 수 있으면 소켓, 아니면 None
+            (framing을 쓰고 프레임 경계에서 멈춘 연결만 반환)
+        """
+        if not self.running:
+            # 시작 전이면 넘겨받은 소켓을 그대로 돌려줌
+            sock, self._adopted_sock = self._adopted_sock, None
+            if sock is not None and not release_socket:
+                sock.close()
+                sock = None
+            return sock
+
+        log.debug("TCP 클라이언트 중지 중...")
         self.running = False
+        self._release_socket = release_socket
 
-        # 즉시 종료 신호 전송
+        # 즉시 종료 신호 전송 (처리 스레드도 대기에서 깨움)
         self.stop_event.set()
-        self.thread_stop_event.set()
-
-        # 프로세스에 종료 명령
-        try:
-            self.command_queue.put_nowait("stop")
-        except:
-            pass
+        self._data_ready.set()
+        self._wake()
 
         # 데이터 처리 스레드 종료 대기
         if self.processor_thread and self.processor_thread.is_alive():
@@ -424,12 +1117,19 @@ class TCPClient:
         if self.tcp_thread and self.tcp_thread.is_alive():
             self.tcp_thread.join(timeout=0.5)
 
-        print("TCP 클라이언트 중지됨")
+        log.info("TCP 클라이언트 중지됨")
+
+        # 루프가 끝났을 때만 반환 (아직 실행 중이면 루프가 소켓을 정리)
+        if self.tcp_thread and self.tcp_thread.is_alive():
+            self._release_socket = False
+            return None
+        sock, self._released_sock = self._released_sock, None
+        return sock
 
     def get_stats(self) -> Dict:
         """통계 정보 반환"""
-        return self.stats.copy()
+        return self.stats.as_dict()
 
     def is_connected(self) -> bool:
         """연결 상태 확인"""
-        return self.stats.get("connected", False)
+        return self.stats.connected
@@ -9,7 +9,7 @@ import threading
 from typing import Dict, Optional
 import atexit
 
-from service.core.asynclogger import AsyncLoggerCore
+from service.core.asynclogger import AsyncLoggerCore, LogListenerHub
 
 
 # ==================== Global Logger Registry ====================
@@ -17,6 +17,9 @@ from service.core.asynclogger import AsyncLoggerCore
 _global_loggers: Dict[str, AsyncLoggerCore] = {}
 _registry_lock = threading.Lock()
 
+# 리스너 방식별 공유 리스너 (모든 로거가 리스너 하나를 공유)
+_shared_hubs: Dict[str, LogListenerHub] = {}
+
 
 # ==================== Logger Manager ====================
 
@@ -36,6 +39,12 @@ class LoggerManager:
         file_output: bool = True,
         max_bytes: int = 10 * 1024 * 1024,
         backup_count: int = 5,
+        batch_size: int = 256,
+        queue_size: int = 65536,
+        block_on_full: bool = False,
+        preserve_record: bool = False,
+        caller_info: bool = True,
+        listener: str = "thread",
         reuse: bool = True,
     ) -> AsyncLoggerCore:
         """
@@ -49,16 +58,34 @@ class LoggerManager:
             file_output: 파일 출력 여부
             max_bytes: 파일 최대 크기
             backup_count: 백업 파일 수
+            batch_size: 리스너 일괄 기록 크기 (공유 리스너 최초 생성 시에만 적용)
+            queue_size: 대기 큐 최대 크기 (공유 리스너 최초 생성 시에만 적용)
+            block_on_full: 큐가 가득 찼을 때 대기 여부 (False면 버림)
+            preserve_record: LogRecord 전체 전송 여부 (사용자 정의 속성 보존)
+            caller_info: 호출 위치 기록 여부
+            listener: 리스너 실행 방식 ("thread" 또는 "process", 방식별로 리스너 공유)
             reuse: 기존 로거 재사용 여부 (False면 항상 새로 생성)
 
         Returns:
             AsyncLoggerCore: 비동기 로거 인스턴스
         """
+        # 기존 로거 재사용 - 락 없이 조회 (dict.get은 GIL 하에서 원자적)
+        if reuse:
+            existing = _global_loggers.get(name)
+            if existing is not None:
+                return existing
+
         with _registry_lock:
-            # 기존 로거 재사용
+            # 락 획득 사이에 다른 스레드가 생성했는지 재확인
             if reuse and name in _global_loggers:
                 return _global_loggers[name]
 
+            # 공유 리스너 조회 또는 생성
+            hub = _shared_hubs.get(listener)
+            if hub is None:
+                hub = LogListenerHub(listener, queue_size=queue_size, batch_size=batch_size)
+                _shared_hubs[listener] = hub
+
             # 새 로거 생성
             logger = AsyncLoggerCore(
                 name=name,
@@ -68,6 +95,13 @@ class LoggerManager:
                 file_output=file_output,
                 max_bytes=max_bytes,
                 backup_count=backup_count,
+                batch_size=batch_size,
+                queue_size=queue_size,
+                block_on_full=block_on_full,
+                preserve_record=preserve_record,
+                caller_info=caller_info,
+                listener=listener,
+                hub=hub,
             )
 
             _global_loggers[name] = logger
@@ -129,8 +163,8 @@ class LoggerManager:
         Returns:
             bool: 존재 여부
         """
-        with _registry_lock:
-            return name in _global_loggers
+        # 읽기 전용 조회는 락 불필요
+        return name in _global_loggers
 
     @staticmethod
     def shutdown_logger(name: str) -> bool:
@@ -174,6 +208,7 @@ class LoggerManager:
                     "log_level": logging.getLevelName(logger.log_level),
                     "console_output": logger.console_output,
                     "file_output": logger.file_output,
+                    "listener": logger.listener,
                     "is_alive": logger.is_alive(),
                 }
             return stats
@@ -190,6 +225,12 @@ def get_logger(
     file_output: bool = True,
     max_bytes: int = 10 * 1024 * 1024,
     backup_count: int = 5,
+    batch_size: int = 256,
+    queue_size: int = 65536,
+    block_on_full: bool = False,
+    preserve_record: bool = False,
+    caller_info: bool = True,
+    listener: str = "thread",
     reuse: bool = True,
 ) -> AsyncLoggerCore:
     """
@@ -204,6 +245,12 @@ def get_logger(
         file_output=file_output,
         max_bytes=max_bytes,
         backup_count=backup_count,
+        batch_size=batch_size,
+        queue_size=queue_size,
+        block_on_full=block_on_full,
+        preserve_record=preserve_record,
+        caller_info=caller_info,
+        listener=listener,
         reuse=reuse,
     )
 
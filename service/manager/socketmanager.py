@@ -4,9 +4,12 @@ Socket Manager with Singleton Pattern
 소켓 매니저 - Singleton 패턴으로 소켓 인스턴스 관리
 """
 
+import socket
 import threading
+import time
 import atexit
-from typing import Optional, Dict
+from types import MappingProxyType
+from typing import Optional, Dict, Mapping, List, Tuple
 from service.core.socket import (
     TCPClient,
     SocketObserver,
@@ -14,6 +17,48 @@ from service.core.socket import (
     ParsedMessage,
 )
 
+# 이전 이름 호환 (서브프로세스 구현에서 스레드 기반 TCPClient로 대체됨)
+SubprocessTCPClient = TCPClient
+
+# 생성된 싱글톤 인스턴스 (get_instance()가 바로 반환)
+_SINGLETON: Optional["SocketManager"] = None
+
+# 연결 풀 - 반환된 연결 유지 시간(초) / 만료 연결 정리 주기(초)
+_POOL_IDLE_TIMEOUT = 60.0
+_POOL_REAP_INTERVAL = 10.0
+
+
+class _PooledConn:
+    """풀에 반환된 유휴 연결"""
+
+    __slots__ = ("sock", "last_used")
+
+    def __init__(self, sock: socket.socket, last_used: float):
+        self.sock = sock
+        self.last_used = last_used
+
+
+def _is_socket_alive(sock: socket.socket) -> bool:
+    """유휴 소켓이 아직 연결되어 있는지 확인 (대기 중인 데이터는 읽지 않음)"""
+    try:
+        sock.setblocking(False)
+        try:
+            return sock.recv(1, socket.MSG_PEEK) != b""
+        finally:
+            sock.setblocking(True)
+    except BlockingIOError:
+        return True  # 연결 유지 중, 대기 데이터 없음
+    except OSError:
+        return False
+
+
+def _close_quietly(sock: socket.socket):
+    """소켓 닫기 (에러 무시)"""
+    try:
+        sock.close()
+    except OSError:
+        pass
+
 
 class SocketManager:
     """
@@ -24,37 +69,49 @@ class SocketManager:
     _instance = None
     _lock = threading.Lock()
 
-    def __new__(cls):
-        """Singleton 패턴 구현"""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
-
-    def __init__(self):
-        """초기화 (한 번만 실행)"""
-        if self._initialized:
-            return
+    _clients_view: Mapping[str, TCPClient]
+    _observers_view: Mapping[str, SocketObserver]
+    _clients_lock: threading.Lock
 
-        # 소켓 인스턴스 저장소
-        self._clients: Dict[str, TCPClient] = {}
-        self._observers: Dict[str, SocketObserver] = {}
-        self._clients_lock = threading.Lock()
+    _pool: Dict[Tuple[str, int, Optional[str]], List[_PooledConn]]
+    _pool_lock: threading.Lock
+    _pool_reaper: Optional[threading.Thread]
+    pool_idle_timeout: float
 
-        # 초기화 완료
-        self._initialized = True
-
-        # 프로그램 종료 시 자동 정리
-        atexit.register(self.shutdown_all)
+    def __new__(cls):
+        """Singleton 패턴 구현 (상태는 최초 생성 시 한 번만 초기화)"""
+        global _SINGLETON
+        instance = cls._instance
+        if instance is None:
+            with cls._lock:
+                instance = cls._instance
+                if instance is None:
+                    instance = super().__new__(cls)
+
+                    # 소켓 인스턴스 저장소 - 변경 시 새 딕셔너리로 교체 (copy-on-write)
+                    # 조회는 락 없이 읽기 전용 뷰를 읽음
+                    instance._clients_view = MappingProxyType({})
+                    instance._observers_view = MappingProxyType({})
+                    instance._clients_lock = threading.Lock()  # 변경 연산 직렬화용
+
+                    # 연결 풀 ((host, port, framing) -> 유휴 연결, remove_client(reuse=True)로 반환된 연결을 재사용)
+                    instance._pool = {}
+                    instance._pool_lock = threading.Lock()
+                    instance._pool_reaper = None  # 첫 반환 시 시작
+                    instance.pool_idle_timeout = _POOL_IDLE_TIMEOUT
+
+                    # 프로그램 종료 시 자동 정리
+                    atexit.register(instance.shutdown_all)
+
+                    # 초기화가 끝난 뒤 공개
+                    cls._instance = instance
+                    _SINGLETON = instance
+        return instance
 
     @classmethod
     def get_instance(cls) -> "SocketManager":
         """싱글톤 인스턴스 반환"""
-        if cls._instance is None:
-            cls()
-        return cls._instance
+        return _SINGLETON or cls()
 
     def create_client(
         self,
@@ -64,6 +121,12 @@ class SocketManager:
         auto_reconnect: bool = True,
         reconnect_interval: float = 5.0,
         buffer_size: int = 4096,
+        use_background_parse: bool = False,
+        framing: Optional[str] = None,
+        reconnect_min: Optional[float] = None,
+        reconnect_max: Optional[float] = None,
+        pool_messages: bool = False,
+        max_frame_size: Optional[int] = None,
     ) -> TCPClient:
         """
         TCP 클라이언트 생성
@@ -75,6 +138,12 @@ class SocketManager:
             auto_reconnect: 자동 재연결 여부
             reconnect_interval: 재연결 간격
             buffer_size: 수신 버퍼 크기
+            use_background_parse: 파싱/알림을 별도 스레드에서 처리할지 여부
+            framing: 수신 프레임 단위 (None: 청크 단위, "length": 길이 헤더 프레임, "line": 줄 단위)
+            reconnect_min: 재연결 대기 시작 상한 (실패할 때마다 2배, None이면 reconnect_interval)
+            reconnect_max: 재연결 대기 최대 상한 (None이면 reconnect_min 지정 시 60초, 아니면 reconnect_interval)
+            pool_messages: ParsedMessage 풀 재사용 여부 (메시지를 보관하는 리스너는 retain() 필요)
+            max_frame_size: framing 사용 시 최대 메시지 크기 (넘으면 on_error 후 연결 끊음, None이면 기본값)
 
         Returns:
             TCPClient 인스턴스
@@ -83,28 +152,206 @@ class SocketManager:
             ValueError: 동일한 이름의 클라이언트가 이미 존재하는 경우
         """
         with self._clients_lock:
-            if name in self._clients:
+            if name in self._clients_view:
                 raise ValueError(f"클라이언트 '{name}'이(가) 이미 존재합니다.")
 
-            # Observer 생성
-            observer = SocketObserver()
-            self._observers[name] = observer
-
-            # TCP 클라이언트 생성
-            client = TCPClient(
-                host=host,
-                port=port,
-                observer=observer,
+            client = self._build_client(
+                name,
+                host,
+                port,
                 auto_reconnect=auto_reconnect,
                 reconnect_interval=reconnect_interval,
                 buffer_size=buffer_size,
+                use_background_parse=use_background_parse,
+                framing=framing,
+                reconnect_min=reconnect_min,
+                reconnect_max=reconnect_max,
+                pool_messages=pool_messages,
+                max_frame_size=max_frame_size,
             )
 
-            self._clients[name] = client
-            print(f"소켓 클라이언트 생성: {name} ({host}:{port})")
+            clients = dict(self._clients_view)
+            clients[name] = client
+            observers = dict(self._observers_view)
+            observers[name] = client.observer
+            self._publish(clients, observers)
 
             return client
 
+    def create_and_start_clients(self, specs: List[Dict]) -> Dict[str, TCPClient]:
+        """
+        여러 클라이언트를 한 번에 생성, 리스너 등록 후 시작
+
+        생성은 락 한 번 안에서 모두 수행하고 저장소도 한 번만 교체
+        (클라이언트마다 create_client / attach_listener / start_client를 호출하는 것과 결과 동일)
+
+        Args:
+            specs: 클라이언트 설정 리스트. 각 항목은 name, host, port 필수,
+                listener(선택)와 create_client의 나머지 인자를 키로 사용
+
+        Returns:
+            {클라이언트명: TCPClient} 딕셔너리 (specs 순서)
+
+        Raises:
+            ValueError: 이미 존재하거나 specs 안에서 중복된 이름이 있는 경우 (아무것도 생성하지 않음)
+            KeyError, TypeError: 필수 키가 없거나 알 수 없는 인자가 있는 경우
+                (앞서 만든 클라이언트는 등록하지 않고 넘겨받은 연결은 풀에 되돌림)
+        """
+        created: Dict[str, TCPClient] = {}
+        listeners = []
+
+        # 1단계: 모두 생성 후 한 번에 공개
+        with self._clients_lock:
+            names = [spec["name"] for spec in specs]
+            for name in names:
+                if name in self._clients_view:
+                    raise ValueError(f"클라이언트 '{name}'이(가) 이미 존재합니다.")
+                if names.count(name) > 1:
+                    raise ValueError(f"클라이언트 '{name}'이(가) specs에 중복되었습니다.")
+
+            try:
+                for spec in specs:
+                    options = dict(spec)
+                    name = options.pop("name")
+                    listener = options.pop("listener", None)
+                    created[name] = self._build_client(
+                        name, options.pop("host"), options.pop("port"), **options
+                    )
+                    if listener is not None:
+                        listeners.append((created[name].observer, listener))
+            except Exception:
+                # 잘못된 설정 - 이미 만든 클라이언트가 풀에서 넘겨받은 연결은 풀에 되돌림
+                for client in created.values():
+                    sock = client.stop(release_socket=True)
+                    if sock is not None:
+                        self._release_to_pool(client.host, client.port, client.framing, sock)
+                raise
+
+            clients = dict(self._clients_view)
+            clients.update(created)
+            observers = dict(self._observers_view)
+            observers.update((name, client.observer) for name, client in created.items())
+            self._publish(clients, observers)
+
+        # 2단계: 리스너 등록 (시작 전에 모두 등록해 첫 메시지부터 수신)
+        for observer, listener in listeners:
+            observer.attach(listener)
+
+        # 3단계: 시작 (스레드 생성만 하므로 순서대로 호출해도 연결은 동시에 진행)
+        for client in created.values():
+            client.start()
+
+        return created
+
+    def _build_client(self, name: str, host: str, port: int, **options) -> TCPClient:
+        """
+        Observer와 TCP 클라이언트 생성 (락 보유 상태에서 호출, 저장소에는 등록하지 않음)
+
+        Args:
+            name: 클라이언트 이름 (출력용)
+            host: 서버 주소
+            port: 포트 번호
+            **options: TCPClient 생성 인자
+
+        Returns:
+            TCPClient 인스턴스
+        """
+        # Observer 생성
+        observer = SocketObserver()
+
+        # TCP 클라이언트 생성
+        client = TCPClient(host=host, port=port, observer=observer, **options)
+
+        # 같은 주소의 유휴 연결이 있으면 첫 연결로 재사용 (핸드셰이크 생략)
+        pooled = self._acquire_from_pool(host, port, options.get("framing"))
+        if pooled is not None:
+            client.adopt_socket(pooled)
+
+        print(
+            f"소켓 클라이언트 생성: {name} ({host}:{port})"
+            + (" - 풀 연결 재사용" if pooled is not None else "")
+        )
+        return client
+
+    def _publish(self, clients: Dict[str, TCPClient], observers: Dict[str, SocketObserver]):
+        """
+        새 저장소 공개 (락 보유 상태에서 호출)
+
+        옵저버 뷰를 먼저 교체하므로 조회된 클라이언트의 옵저버는 항상 존재
+        """
+        self._observers_view = MappingProxyType(observers)
+        self._clients_view = MappingProxyType(clients)
+
+    def _acquire_from_pool(
+        self, host: str, port: int, framing: Optional[str]
+    ) -> Optional[socket.socket]:
+        """
+        같은 주소의 유휴 연결 꺼내기 (만료되거나 끊긴 연결은 닫고 건너뜀)
+
+        Returns:
+            재사용 가능한 소켓 또는 None
+        """
+        expires = time.monotonic() - self.pool_idle_timeout
+        stale = []
+        found = None
+
+        with self._pool_lock:
+            bucket = self._pool.get((host, port, framing))
+            while bucket:
+                conn = bucket.pop()  # 가장 최근에 반환된 연결부터
+                if conn.last_used > expires and _is_socket_alive(conn.sock):
+                    found = conn.sock
+                    break
+                stale.append(conn.sock)
+            if bucket is not None and not bucket:
+                del self._pool[(host, port, framing)]
+
+        for sock in stale:
+            _close_quietly(sock)
+        return found
+
+    def _release_to_pool(
+        self, host: str, port: int, framing: Optional[str], sock: socket.socket
+    ):
+        """연결을 풀에 반환 (pool_idle_timeout 동안 같은 주소/framing의 클라이언트가 재사용 가능)"""
+        with self._pool_lock:
+            self._pool.setdefault((host, port, framing), []).append(
+                _PooledConn(sock, time.monotonic())
+            )
+
+            # 만료 연결 정리 스레드 (처음 반환될 때 시작)
+            if self._pool_reaper is None:
+                self._pool_reaper = threading.Thread(
+                    target=self._reap_pool, daemon=True, name="SocketPoolReaper"
+                )
+                self._pool_reaper.start()
+
+    def _reap_pool(self):
+        """만료된 유휴 연결 주기적으로 닫기 (데몬 스레드)"""
+        while True:
+            time.sleep(_POOL_REAP_INTERVAL)
+            self._close_pooled(time.monotonic() - self.pool_idle_timeout)
+
+    def _close_pooled(self, before: float):
+        """
+        before 이전에 반환된 유휴 연결 닫기
+
+        Args:
+            before: 기준 시각 (time.monotonic(), inf면 전부)
+        """
+        expired = []
+        with self._pool_lock:
+            for key, bucket in list(self._pool.items()):
+                keep = [conn for conn in bucket if conn.last_used >= before]
+                expired.extend(conn.sock for conn in bucket if conn.last_used < before)
+                if keep:
+                    self._pool[key] = keep
+                else:
+                    del self._pool[key]
+
+        for sock in expired:
+            _close_quietly(sock)
+
     def get_client(self, name: str) -> Optional[TCPClient]:
         """
         클라이언트 조회
@@ -115,8 +362,7 @@ class SocketManager:
         Returns:
             TCPClient 인스턴스 또는 None
         """
-        with self._clients_lock:
-            return self._clients.get(name)
+        return self._clients_view.get(name)
 
     def get_observer(self, name: str) -> Optional[SocketObserver]:
         """
@@ -128,8 +374,7 @@ class SocketManager:
         Returns:
             SocketObserver 인스턴스 또는 None
         """
-        with self._clients_lock:
-            return self._observers.get(name)
+        return self._observers_view.get(name)
 
     def attach_listener(self, name: str, listener: SocketDataListener):
         """
@@ -197,26 +442,32 @@ class SocketManager:
 
         client.stop()
 
-    def remove_client(self, name: str):
+    def remove_client(self, name: str, reuse: bool = False):
         """
         클라이언트 제거 (중지 후 삭제)
 
         Args:
             name: 클라이언트 이름
+            reuse: True면 연결을 닫지 않고 풀에 반환해 같은 주소/framing의 새 클라이언트가 재사용
+                (framing을 쓰는 클라이언트가 프레임 경계에서 멈춘 경우만, 서버는 연결 종료를 알지 못함)
         """
         with self._clients_lock:
-            client = self._clients.get(name)
+            client = self._clients_view.get(name)
             if client:
-                # 중지
+                # 중지 (재사용 요청이고 연결이 정상이면 닫지 않고 풀에 반환)
                 try:
-                    client.stop()
+                    sock = client.stop(release_socket=reuse)
+                    if sock is not None:
+                        self._release_to_pool(client.host, client.port, client.framing, sock)
                 except:
                     pass
 
                 # 삭제
-                del self._clients[name]
-                if name in self._observers:
-                    del self._observers[name]
+                clients = dict(self._clients_view)
+                del clients[name]
+                observers = dict(self._observers_view)
+                observers.pop(name, None)
+                self._publish(clients, observers)
 
                 print(f"소켓 클라이언트 제거: {name}")
 
@@ -259,8 +510,7 @@ class SocketManager:
         Returns:
             클라이언트 이름 리스트
         """
-        with self._clients_lock:
-            return list(self._clients.keys())
+        return list(self._clients_view)
 
     def get_all_stats(self) -> Dict[str, Dict]:
         """
@@ -269,23 +519,26 @@ class SocketManager:
         Returns:
             {클라이언트명: 통계} 딕셔너리
         """
-        with self._clients_lock:
-            return {name: client.get_stats() for name, client in self._clients.items()}
+        return {name: client.get_stats() for name, client in self._clients_view.items()}
 
     def shutdown_all(self):
         """모든 클라이언트 종료"""
         print("모든 소켓 클라이언트 종료 중...")
 
+        # 저장소만 락 안에서 비우고, 시간이 걸리는 중지는 락 밖에서 수행
         with self._clients_lock:
-            for name, client in list(self._clients.items()):
-                try:
-                    print(f"  - {name} 종료 중...")
-                    client.stop()
-                except Exception as e:
-                    print(f"  - {name} 종료 실패: {e}")
+            clients = self._clients_view
+            self._publish({}, {})
 
-            self._clients.clear()
-            self._observers.clear()
+        for name, client in clients.items():
+            try:
+                print(f"  - {name} 종료 중...")
+                client.stop()
+            except Exception as e:
+                print(f"  - {name} 종료 실패: {e}")
+
+        # 풀의 유휴 연결 모두 닫기
+        self._close_pooled(float("inf"))
 
         print("모든 소켓 클라이언트 종료 완료")
 
@@ -294,8 +547,19 @@ class SocketManager:
 
 
 def get_socket_manager() -> SocketManager:
-    """소켓 매니저 인스턴스 반환 (싱글톤)"""
-    return SocketManager.get_instance()
+    """소켓 매니저 인스턴스 반환 (싱글톤, 생성 후에는 모듈 전역 조회만)"""
+    return _SINGLETON or SocketManager()
+
+
+def __getattr__(name: str):
+    """
+    모듈 속성 지연 생성 (PEP 562)
+
+    `from service.manager.socketmanager import socket_manager`로 싱글톤 인스턴스 접근
+    """
+    if name == "socket_manager":
+        return get_socket_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def create_socket_client(
@@ -305,6 +569,12 @@ def create_socket_client(
     auto_reconnect: bool = True,
     reconnect_interval: float = 5.0,
     buffer_size: int = 4096,
+    use_background_parse: bool = False,
+    framing: Optional[str] = None,
+    reconnect_min: Optional[float] = None,
+    reconnect_max: Optional[float] = None,
+    pool_messages: bool = False,
+    max_frame_size: Optional[int] = None,
 ) -> TCPClient:
     """
     소켓 클라이언트 생성 (편의 함수)
@@ -316,6 +586,12 @@ def create_socket_client(
         auto_reconnect: 자동 재연결 여부
         reconnect_interval: 재연결 간격
         buffer_size: 수신 버퍼 크기
+        use_background_parse: 파싱/알림을 별도 스레드에서 처리할지 여부
+        framing: 수신 프레임 단위 (None: 청크 단위, "length": 길이 헤더 프레임, "line": 줄 단위)
+        reconnect_min: 재연결 대기 시작 상한 (실패할 때마다 2배, None이면 reconnect_interval)
+        reconnect_max: 재연결 대기 최대 상한 (None이면 reconnect_min 지정 시 60초, 아니면 reconnect_interval)
+        pool_messages: ParsedMessage 풀 재사용 여부 (메시지를 보관하는 리스너는 retain() 필요)
+        max_frame_size: framing 사용 시 최대 메시지 크기 (넘으면 on_error 후 연결 끊음, None이면 기본값)
 
     Returns:
         TCPClient 인스턴스
@@ -328,6 +604,12 @@ def create_socket_client(
         auto_reconnect=auto_reconnect,
         reconnect_interval=reconnect_interval,
         buffer_size=buffer_size,
+        use_background_parse=use_background_parse,
+        framing=framing,
+        reconnect_min=reconnect_min,
+        reconnect_max=reconnect_max,
+        pool_messages=pool_messages,
+        max_frame_size=max_frame_size,
     )
 
 
@@ -355,7 +637,7 @@ def stop_socket_client(name: str):
     manager.stop_client(name)
 
 
-def remove_socket_client(name: str):
+def remove_socket_client(name: str, reuse: bool = False):
     """소켓 클라이언트 제거 (편의 함수)"""
     manager = get_socket_manager()
-    manager.remove_client(name)
+    manager.remove_client(name, reuse=reuse)
@@ -7,9 +7,10 @@
 import sys
 from pathlib import Path
 
-# 프로젝트 루트를 sys.path에 추가
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# 프로젝트 루트를 sys.path에 추가 (이미 있으면 중복 추가하지 않음)
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from service.manager.logmanager import get_logger
 import time
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+공유 리스너 로그 라우팅 테스트 (프로세스 모드, 로거 2개)
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가 (이미 있으면 중복 추가하지 않음)
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import logging
+import tempfile
+import threading
+import time
+from service.core._listener_entry import _PENDING_TTL, _dispatch, _expire_pending
+from service.manager.logmanager import get_logger, shutdown_all_loggers
+
+
+def _write_logs(log, tag: str, count: int):
+    """로그 count개 기록 (마지막에 예외 로그 1개)"""
+    for i in range(count):
+        log.info(f"{tag} 메시지 #{i}")
+    try:
+        raise ValueError(tag)
+    except ValueError:
+        log.exception(f"{tag} 예외")
+
+
+def _read_lines(path: Path) -> list[str]:
+    """로그 파일의 레코드 줄 (예외 traceback 줄 제외)"""
+    return [line for line in path.read_text(encoding="utf-8").splitlines() if " [" in line and "] " in line]
+
+
+class _Collect(logging.Handler):
+    """받은 레코드를 모으는 핸들러"""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def test_dispatch_pending():
+    """연결 전 로거의 레코드는 자기 구간만 보류되는지 확인 (다른 로거 레코드 복사 없음)"""
+    listener = logging.Logger("routing_rb_listener")
+    collect = _Collect()
+    listener.addHandler(collect)
+
+    # ra(미연결)와 rb(연결)의 레코드가 번갈아 도착
+    records = [
+        logging.makeLogRecord({"msg": f"{tag} #{i}", "levelno": logging.INFO, "_target_logger": tag})
+        for i in range(3)
+        for tag in ("ra", "ra", "rb")
+    ]
+    pending = {}
+    _dispatch({"rb": listener}, pending, records)
+
+    held = [r.msg for r in pending["ra"]]
+    written = [r.msg for r in collect.records]
+    print(f"  보류(ra): {len(held)}개, 기록(rb): {len(written)}개")
+    if held != [r.msg for r in records if r._target_logger == "ra"] or len(written) != 3:
+        raise AssertionError("연결 전 레코드 보류 구간이 올바르지 않습니다")
+
+
+def test_pending_expiry():
+    """연결되지 않는 로거의 보류 레코드가 _PENDING_TTL 뒤 버려지는지 확인"""
+    now = time.time()
+    records = [
+        logging.makeLogRecord(
+            {"msg": f"{tag} #{i}", "levelno": logging.INFO, "_target_logger": tag, "created": created}
+        )
+        for i in range(3)
+        for tag, created in (("old", now - _PENDING_TTL - 1), ("new", now))
+    ]
+    pending = {}
+    _dispatch({}, pending, records)
+    _expire_pending(pending)
+
+    print(f"  남은 보류 로거: {sorted(pending)}")
+    if sorted(pending) != ["new"]:
+        raise AssertionError("오래된 보류 레코드가 버려지지 않았습니다")
+
+
+def test_process_mode_routing(count: int = 100):
+    """두 로거의 레코드가 각자의 파일에만 정확히 한 번씩 기록되는지 확인"""
+    print("=== 프로세스 모드 로그 라우팅 테스트 ===\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_dir = Path(tmp)
+        tags = ("ra", "rb")
+
+        def run(tag: str):
+            # 생성 직후 바로 기록 (연결 메시지보다 먼저 도착한 레코드가 보류되는 경로 포함)
+            log = get_logger(
+                f"routing_{tag}",
+                log_dir=str(log_dir),
+                console_output=False,
+                listener="process",
+                reuse=False,
+            )
+            _write_logs(log, tag, count)
+
+        # 두 로거가 동시에 기록 (리스너 배치 안에서 레코드가 섞이도록)
+        threads = [threading.Thread(target=run, args=(tag,)) for tag in tags]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        shutdown_all_loggers()
+
+        ok = True
+        for tag in tags:
+            lines = _read_lines(log_dir / f"routing_{tag}.log")
+            errors = _read_lines(log_dir / f"routing_{tag}_error.log")
+            foreign = [line for line in lines + errors if f"routing_{tag} " not in line]
+            print(f"  routing_{tag}.log: {len(lines)}줄, _error.log: {len(errors)}줄, 다른 로거 레코드: {len(foreign)}줄")
+            ok = ok and len(lines) == count + 1 and len(errors) == 1 and not foreign
+
+        if not ok:
+            raise AssertionError("로거별 파일에 기록된 레코드가 올바르지 않습니다")
+
+    print("\n라우팅 테스트 통과")
+
+
+def test_same_name_new_config():
+    """같은 이름을 다른 설정(log_dir)으로 다시 만들면 새 설정으로 기록되는지 확인 (프로세스 모드)"""
+    print("\n=== 같은 이름, 다른 설정 테스트 ===\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_dir = Path(tmp)
+        first = get_logger("routing_same", log_dir=str(log_dir / "a"), console_output=False, listener="process")
+        first.info("첫 번째 설정")
+        second = get_logger(
+            "routing_same",
+            log_dir=str(log_dir / "b"),
+            console_output=False,
+            listener="process",
+            reuse=False,
+        )
+        second.info("두 번째 설정")
+
+        # 첫 로거는 레지스트리에서 교체되었으므로 직접 종료
+        first.shutdown()
+        shutdown_all_loggers()
+
+        counts = {sub: len(_read_lines(log_dir / sub / "routing_same.log")) for sub in ("a", "b")}
+        print(f"  a/routing_same.log: {counts['a']}줄, b/routing_same.log: {counts['b']}줄")
+        if counts != {"a": 1, "b": 1}:
+            raise AssertionError("새 설정의 로그가 이전 설정 위치에 기록되었습니다")
+
+    print("\n설정 분리 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_dispatch_pending()
+    test_pending_expiry()
+    test_process_mode_routing()
+    test_same_name_new_config()
@@ -5,6 +5,7 @@ Singleton 패턴을 사용한 소켓 관리
 """
 
 import time
+from array import array
 from service.manager.socketmanager import (
     SocketManager,
     get_socket_manager,
@@ -42,17 +43,26 @@ class DataCollectorListener(SocketDataListener):
 
     def __init__(self, name: str):
         self.name = name
-        self.data_list = []
+
+        # 열 단위 저장 (메시지마다 딕셔너리 생성 없음, 시각은 float 배열)
+        self.types: list[str] = []
+        self.payloads: list = []
+        self.timestamps = array("d")
+
+        # 진행 출력 간격 (print_every개마다 또는 0.5초마다 한 번)
+        self._print_every = 100
+        self._last_print_t = 0.0
 
     def on_data_received(self, data: ParsedMessage):
-        self.data_list.append(
-            {
-                "type": data.message_type,
-                "payload": data.payload,
-                "timestamp": data.timestamp,
-            }
-        )
-        print(f"[{self.name}] 수집: {len(self.data_list)}개")
+        self.types.append(data.message_type)
+        self.payloads.append(data.payload)
+        self.timestamps.append(data.timestamp)
+
+        n = len(self.types)
+        now = time.monotonic()
+        if n % self._print_every == 0 or now - self._last_print_t > 0.5:
+            print(f"[{self.name}] 수집: {n}개")
+            self._last_print_t = now
 
     def on_connection_changed(self, connected: bool):
         status = "연결" if connected else "끊김"
@@ -76,12 +86,19 @@ def test_singleton_pattern():
     manager2 = SocketManager.get_instance()
     manager3 = get_socket_manager()
 
-    # 모두 같은 인스턴스인지 확인
-    print(f"manager1 is manager2: {manager1 is manager2}")
-    print(f"manager2 is manager3: {manager2 is manager3}")
-    print(f"manager1 is manager3: {manager1 is manager3}")
+    # 모두 같은 인스턴스인지 확인 (한 번만 비교)
+    ok12 = manager1 is manager2
+    ok23 = manager2 is manager3
+    ok13 = manager1 is manager3
+    print(
+        f"manager1 is manager2: {ok12}\n"
+        f"manager2 is manager3: {ok23}\n"
+        f"manager1 is manager3: {ok13}"
+    )
 
-    assert manager1 is manager2 is manager3, "Singleton 패턴 실패!"
+    # python -O에서도 검사되도록 assert 대신 직접 예외
+    if not (ok12 and ok23 and ok13):
+        raise AssertionError("Singleton 패턴 실패!")
     print("✓ Singleton 패턴 동작 확인")
 
 
@@ -132,28 +149,24 @@ def test_multiple_clients():
 
     manager = get_socket_manager()
 
-    # 3개의 클라이언트 생성
+    # 3개의 클라이언트를 한 번에 생성, 리스너 등록, 시작
     ports = [8888, 8889, 8890]
-    for i, port in enumerate(ports):
-        name = f"client_{i+1}"
-        try:
-            client = manager.create_client(
-                name=name,
-                host="localhost",
-                port=port,
-                auto_reconnect=True,
-                reconnect_interval=3.0,
-            )
-
-            # 각 클라이언트에 리스너 등록
-            listener = DataCollectorListener(name)
-            manager.attach_listener(name, listener)
-
-            # 시작
-            manager.start_client(name)
-
-        except Exception as e:
-            print(f"{name} 생성 실패: {e}")
+    try:
+        manager.create_and_start_clients([
+            {
+                "name": f"client_{i+1}",
+                "host": "localhost",
+                "port": port,
+                "listener": DataCollectorListener(f"client_{i+1}"),
+                "auto_reconnect": True,
+                "reconnect_min": 0.5,
+                "reconnect_max": 30.0,
+            }
+            for i, port in enumerate(ports)
+        ])
+
+    except Exception as e:
+        print(f"클라이언트 생성 실패: {e}")
 
     # 클라이언트 목록 확인
     clients = manager.list_clients()
@@ -238,6 +251,62 @@ def test_error_handling():
     manager.remove_client("duplicate")
 
 
+def test_batch_create_failure():
+    """일괄 생성 중 잘못된 설정이 있을 때 정리 테스트 (로컬 서버 사용)"""
+    import socket
+    import threading
+
+    print("\n" + "=" * 50)
+    print("테스트 5-1: 일괄 생성 실패 시 정리")
+    print("=" * 50)
+
+    manager = get_socket_manager()
+
+    # 한 줄 보내고 연결을 유지하는 로컬 서버
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(4)
+    port = server.getsockname()[1]
+    accepted = []
+
+    def serve():
+        while True:
+            conn, _ = server.accept()
+            accepted.append(conn)
+            conn.sendall(b'{"type": "hello"}\n')
+
+    threading.Thread(target=serve, daemon=True).start()
+
+    # 재사용할 연결을 풀에 하나 보관
+    manager.create_client("pooled", "127.0.0.1", port, auto_reconnect=False, framing="line")
+    manager.start_client("pooled")
+    time.sleep(0.3)
+    manager.remove_client("pooled", reuse=True)
+
+    # 첫 설정이 풀 연결을 넘겨받은 뒤 두 번째 설정(port 누락)에서 실패
+    try:
+        manager.create_and_start_clients([
+            {"name": "batch_1", "host": "127.0.0.1", "port": port, "framing": "line"},
+            {"name": "batch_2", "host": "127.0.0.1"},
+            {"name": "batch_3", "host": "127.0.0.1", "port": port, "framing": "line"},
+        ])
+        raise AssertionError("잘못된 설정이 거부되지 않았습니다")
+    except KeyError as e:
+        print(f"✓ 잘못된 설정 거부: {e}")
+
+    registered = [name for name in manager.list_clients() if name.startswith("batch_")]
+    pooled = len(manager._pool.get(("127.0.0.1", port, "line"), ()))
+    print(f"✓ 등록된 클라이언트: {registered}, 풀에 되돌린 연결: {pooled}개")
+    if registered or pooled != 1:
+        raise AssertionError("실패한 일괄 생성의 클라이언트/연결이 정리되지 않았습니다")
+
+    # 정리
+    manager.shutdown_all()
+    for conn in accepted:
+        conn.close()
+    server.close()
+
+
 # ==================== 클래스 내부 사용 예제 ====================
 
 
@@ -333,6 +402,9 @@ def main():
     # 테스트 5: 에러 처리
     test_error_handling()
 
+    # 테스트 5-1: 일괄 생성 실패 시 정리 (로컬 서버 사용)
+    test_batch_create_failure()
+
     # 테스트 6: 애플리케이션 클래스 (서버 필요)
     # test_application_usage()
 
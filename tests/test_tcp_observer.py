@@ -7,12 +7,14 @@
 import sys
 from pathlib import Path
 
-# 프로젝트 루트를 sys.path에 추가
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# 프로젝트 루트를 sys.path에 추가 (이미 있으면 중복 추가하지 않음)
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 import time
 import json
+from array import array
 from service.manager.socketmanager import (
     SubprocessTCPClient,
     SocketObserver,
@@ -21,18 +23,40 @@ from service.manager.socketmanager import (
 )
 
 
+# Mock 서버가 보내는 메시지 (한 줄에 한 메시지, 미리 인코딩)
+_MOCK_PAYLOADS: tuple[bytes, ...] = tuple(
+    json.dumps({"type": "test", "id": i + 1, "data": f"테스트 메시지 #{i+1}"}).encode() + b"\n"
+    for i in range(5)
+) + (b"Plain text message\n",)
+
+
 # ==================== 리스너 구현 예제 ====================
 
 
 class ConsoleLogger(SocketDataListener):
     """콘솔에 로그 출력하는 리스너"""
 
+    def __init__(self):
+        # 마지막으로 포맷한 초와 문자열 (같은 초의 메시지는 strftime 생략)
+        self._ts_sec = -1
+        self._ts_text = ""
+
+    def _format_time(self, timestamp: float) -> str:
+        sec = int(timestamp)
+        if sec != self._ts_sec:
+            self._ts_text = time.strftime("%H:%M:%S", time.localtime(sec))
+            self._ts_sec = sec
+        return self._ts_text
+
     def on_data_received(self, data: ParsedMessage):
-        print(f"\n[ConsoleLogger] 데이터 수신:")
-        print(f"  타입: {data.message_type}")
-        print(f"  페이로드: {data.payload}")
-        print(f"  크기: {len(data.raw_data)} bytes")
-        print(f"  시간: {time.strftime('%H:%M:%S', time.localtime(data.timestamp))}")
+        # 한 번에 출력 (stdout 락 1회)
+        sys.stdout.write(
+            f"\n[ConsoleLogger] 데이터 수신:\n"
+            f"  타입: {data.message_type}\n"
+            f"  페이로드: {data.payload}\n"
+            f"  크기: {len(data.raw_data)} bytes\n"
+            f"  시간: {self._format_time(data.timestamp)}\n"
+        )
 
     def on_connection_changed(self, connected: bool):
         status = "연결됨" if connected else "연결 끊김"
@@ -46,12 +70,39 @@ class DataCollector(SocketDataListener):
     """데이터를 수집하는 리스너"""
 
     def __init__(self):
-        self.collected_data = []
+        # 열 단위 저장 (요약 시 메시지 객체를 순회하지 않음, 시각은 float 배열)
+        self.types: list[str] = []
+        self.payloads: list = []
+        self.timestamps = array("d")
         self.connection_count = 0
 
+        # 메시지 타입 종류 (종류가 적으므로 수신 시 갱신 - 요약 시 전체 순회 없음)
+        self._type_set: set[str] = set()
+
+        # 진행 출력 간격 (print_every개마다 또는 0.5초마다 한 번)
+        self._print_every = 100
+        self._last_print_t = 0.0
+
+    def _report_progress(self, n: int):
+        now = time.monotonic()
+        if n % self._print_every == 0 or now - self._last_print_t > 0.5:
+            print(f"[DataCollector] 수집된 데이터: {n}개")
+            self._last_print_t = now
+
     def on_data_received(self, data: ParsedMessage):
-        self.collected_data.append(data)
-        print(f"[DataCollector] 수집된 데이터: {len(self.collected_data)}개")
+        self.types.append(data.message_type)
+        self.payloads.append(data.payload)
+        self.timestamps.append(data.timestamp)
+        self._type_set.add(data.message_type)
+        self._report_progress(len(self.types))
+
+    def on_data_batch(self, messages: list[ParsedMessage]):
+        start = len(self.types)
+        self.types.extend(m.message_type for m in messages)
+        self._type_set.update(self.types[start:])
+        self.payloads.extend(m.payload for m in messages)
+        self.timestamps.extend(m.timestamp for m in messages)
+        self._report_progress(len(self.types))
 
     def on_connection_changed(self, connected: bool):
         if connected:
@@ -63,9 +114,9 @@ class DataCollector(SocketDataListener):
 
     def get_summary(self):
         return {
-            "total_messages": len(self.collected_data),
+            "total_messages": len(self.types),
             "connection_count": self.connection_count,
-            "message_types": list(set(d.message_type for d in self.collected_data)),
+            "message_types": list(self._type_set),
         }
 
 
@@ -158,65 +209,71 @@ def test_tcp_client_with_observer():
 
 def test_with_mock_server():
     """Mock 서버와 함께 테스트"""
-    import socket as s
+    import asyncio
     import threading
 
-    def mock_server():
-        """간단한 Mock TCP 서버"""
-        server = s.socket(s.AF_INET, s.SOCK_STREAM)
-        server.setsockopt(s.SOL_SOCKET, s.SO_REUSEADDR, 1)
-        server.bind(("127.0.0.1", 8889))
-        server.listen(1)
-        print("[Mock서버] 포트 8889에서 대기 중...")
+    handler_done = threading.Event()
 
+    async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """클라이언트에 테스트 메시지 전송 (한 줄에 한 메시지)"""
+        print(f"[Mock서버] 클라이언트 연결: {writer.get_extra_info('peername')}")
         try:
-            conn, addr = server.accept()
-            print(f"[Mock서버] 클라이언트 연결: {addr}")
-
-            # JSON 메시지 전송
-            for i in range(5):
-                message = json.dumps(
-                    {"type": "test", "id": i + 1, "data": f"테스트 메시지 #{i+1}"}
-                )
-                conn.sendall(message.encode() + b"\n")
-                time.sleep(1)
-
-            # 텍스트 메시지 전송
-            conn.sendall(b"Plain text message\n")
-            time.sleep(1)
-
-            conn.close()
+            # JSON 메시지 5개 + 텍스트 메시지를 한 번에 전송 (소켓 쓰기 1회)
+            writer.writelines(_MOCK_PAYLOADS)
+            await writer.drain()
         except Exception as e:
             print(f"[Mock서버] 에러: {e}")
         finally:
-            server.close()
+            writer.close()
+            handler_done.set()
+
+    async def start_mock_server() -> asyncio.AbstractServer:
+        """간단한 Mock TCP 서버"""
+        server = await asyncio.start_server(handle_client, "127.0.0.1", 8889)
+        print("[Mock서버] 포트 8889에서 대기 중...")
+        return server
+
+    async def stop_mock_server(server: asyncio.AbstractServer):
+        server.close()
+        await server.wait_closed()
 
     print("=== Mock 서버와 함께 테스트 ===\n")
 
-    # Mock 서버 시작
-    server_thread = threading.Thread(target=mock_server, daemon=True)
-    server_thread.start()
-    time.sleep(0.5)
+    # Mock 서버 시작 (이벤트 루프 스레드 하나에서 실행)
+    # start_server()가 끝나면 이미 listen 상태이므로 결과를 기다리는 것이 준비 신호 (고정 sleep 없음)
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    server = asyncio.run_coroutine_threadsafe(start_mock_server(), loop).result(timeout=5)
 
     # 옵저버 및 리스너
     observer = SocketObserver()
     observer.attach(ConsoleLogger())
-    observer.attach(DataCollector())
+    data_collector = DataCollector()
+    observer.attach(data_collector)
 
-    # 클라이언트 시작
+    # 클라이언트 시작 (메시지가 한 번에 도착해도 줄 단위로 분리)
+    # 리스너가 메시지 객체를 보관하지 않으므로 (DataCollector는 필드만 복사) 메시지 풀 사용
     client = SubprocessTCPClient(
         host="127.0.0.1",
         port=8889,
         observer=observer,
         auto_reconnect=False,
+        framing="line",
+        pool_messages=True,
     )
     client.start()
 
-    # 10초 대기
-    time.sleep(10)
+    # 6개 메시지를 모두 받을 때까지 대기 (최대 10초)
+    deadline = time.monotonic() + 10
+    while len(data_collector.types) < 6 and time.monotonic() < deadline:
+        time.sleep(0.01)
 
     # 종료
     client.stop()
+    handler_done.wait(timeout=1)
+    asyncio.run_coroutine_threadsafe(stop_mock_server(server), loop).result(timeout=5)
+    loop.call_soon_threadsafe(loop.stop)
+    print(f"\n수신 메시지: {len(data_collector.types)}개")
     print("\nMock 서버 테스트 종료")
 
 